@@ -1,10 +1,28 @@
+import copy
+import hashlib
 import httpx
 import asyncio
 import logging
 import os
+import time
+from collections import OrderedDict
 from typing import List, Optional
 
+# Rendered chafa posters persist here so repeat views across sessions are a
+# file read instead of a download plus a chafa subprocess
+POSTER_DISK_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "riven-tui", "chafa"
+)
+
 class RivenAPI:
+    # TTLs for the in-memory TMDB response cache (seconds). Details barely
+    # change within a session; trending rotates faster.
+    TMDB_DETAILS_TTL = 6 * 3600
+    TMDB_TRENDING_TTL = 600
+    TMDB_CACHE_MAX_ENTRIES = 1024
+    POSTER_CACHE_MAX_ENTRIES = 64
+    PARSED_TITLE_CACHE_MAX_ENTRIES = 512
+
     def __init__(self, be_base_url, fe_base_url, timeout=10.0):
         self.mdblist_api_key = "kgx75hvk95is39a6joe68tgux"
         headers = {
@@ -31,6 +49,27 @@ class RivenAPI:
         self.logger = logging.getLogger("Riven.API")
         self.logger.propagate = True
         self.chafa_semaphore = asyncio.Semaphore(3)
+        self._tmdb_cache: dict = {}
+        # key -> running fetch task, so concurrent lookups for the same
+        # title share one request instead of racing duplicates
+        self._tmdb_inflight: dict = {}
+        # Rendered chafa output keyed by (url, width, height); LRU-bounded
+        self._poster_cache: OrderedDict = OrderedDict()
+        # url -> (etag, parsed body) for conditional GETs on polled endpoints
+        self._etags: dict = {}
+        # filename -> parsed result from /scrape/parse; LRU-bounded
+        self._parsed_title_cache: OrderedDict = OrderedDict()
+
+    def _tmdb_cache_get(self, key, ttl: float):
+        cached = self._tmdb_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+
+    def _tmdb_cache_set(self, key, data):
+        if len(self._tmdb_cache) >= self.TMDB_CACHE_MAX_ENTRIES:
+            self._tmdb_cache.clear()
+        self._tmdb_cache[key] = (time.monotonic(), data)
 
     async def get_mdblist_items(self, list_url_or_id: str):
         # Handle full URL or just the "user/listname" string
@@ -258,12 +297,75 @@ class RivenAPI:
             return None, str(e)
 
     async def parse_torrent_titles(self, titles: list, riven_key: str):
+        # Re-selecting streams re-parses mostly identical filenames; parsed
+        # entries are cached per title so only unseen ones hit the endpoint.
+        unknown = [t for t in titles if t not in self._parsed_title_cache]
+        if unknown:
+            try:
+                resp = await self.client.post(f"{self.be_base_url}{self.api_base_path}/scrape/parse", headers={"x-api-key": str(riven_key)}, json=unknown)
+                if resp.status_code != 200: return None, "Error"
+                payload = resp.json()
+            except Exception as e: return None, str(e)
+
+            data = payload.get("data") if isinstance(payload, dict) else None
+            if data is None or len(data) != len(unknown):
+                # Results can't be attributed to titles positionally; refetch
+                # the full list uncached rather than mixing in cache entries
+                if unknown == titles:
+                    return payload, None
+                try:
+                    resp = await self.client.post(f"{self.be_base_url}{self.api_base_path}/scrape/parse", headers={"x-api-key": str(riven_key)}, json=titles)
+                    return (resp.json(), None) if resp.status_code == 200 else (None, "Error")
+                except Exception as e: return None, str(e)
+
+            for t, parsed in zip(unknown, data):
+                self._parsed_title_cache[t] = parsed
+
+        for t in titles:
+            self._parsed_title_cache.move_to_end(t)
+        result = {"data": [self._parsed_title_cache[t] for t in titles]}
+        while len(self._parsed_title_cache) > self.PARSED_TITLE_CACHE_MAX_ENTRIES:
+            self._parsed_title_cache.popitem(last=False)
+        return result, None
+
+    def _poster_disk_path(self, poster_url: str, width: int, height: Optional[int]) -> str:
+        digest = hashlib.sha1(poster_url.encode()).hexdigest()
+        size = f"w{width}x{height or ''}"
+        return os.path.join(POSTER_DISK_CACHE_DIR, f"{digest}-{size}.ansi")
+
+    def _poster_disk_read(self, path: str) -> Optional[str]:
         try:
-            resp = await self.client.post(f"{self.be_base_url}{self.api_base_path}/scrape/parse", headers={"x-api-key": str(riven_key)}, json=titles)
-            return (resp.json(), None) if resp.status_code == 200 else (None, "Error")
-        except Exception as e: return None, str(e)
+            with open(path, "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _poster_disk_write(self, path: str, poster_art: str) -> None:
+        try:
+            os.makedirs(POSTER_DISK_CACHE_DIR, exist_ok=True)
+            with open(path, "w") as f:
+                f.write(poster_art)
+        except OSError:
+            pass
 
     async def get_poster_chafa(self, poster_url: str, width: int = 80, height: Optional[int] = None):
+        # Download + chafa render costs hundreds of ms; back-navigation and
+        # resize re-requests for the same poster/size are served from cache.
+        key = (poster_url, width, height)
+        cached = self._poster_cache.get(key)
+        if cached is not None:
+            self._poster_cache.move_to_end(key)
+            return cached, None
+
+        # Second tier: rendered art persisted across sessions
+        disk_path = self._poster_disk_path(poster_url, width, height)
+        poster_art = await asyncio.to_thread(self._poster_disk_read, disk_path)
+        if poster_art is not None:
+            self._poster_cache[key] = poster_art
+            if len(self._poster_cache) > self.POSTER_CACHE_MAX_ENTRIES:
+                self._poster_cache.popitem(last=False)
+            return poster_art, None
+
         # NEW: Put the whole process inside the semaphore block
         async with self.chafa_semaphore:
             try:
@@ -280,8 +382,13 @@ class RivenAPI:
                     await process.stdin.drain()
                     process.stdin.close()
                     stdout, _ = await process.communicate()
-                    return stdout.decode(), None
-            except Exception as e: 
+                    poster_art = stdout.decode()
+                    self._poster_cache[key] = poster_art
+                    if len(self._poster_cache) > self.POSTER_CACHE_MAX_ENTRIES:
+                        self._poster_cache.popitem(last=False)
+                    await asyncio.to_thread(self._poster_disk_write, disk_path, poster_art)
+                    return poster_art, None
+            except Exception as e:
                 return None, str(e)
 
     async def search_tmdb(self, query: str, token: str):
@@ -294,32 +401,89 @@ class RivenAPI:
         except Exception as e: return None, str(e)
 
     async def get_tmdb_details(self, media_type: str, tmdb_id: int, token: str):
+        key = ("details", media_type, tmdb_id)
+        cached = self._tmdb_cache_get(key, self.TMDB_DETAILS_TTL)
+        if cached is not None:
+            return cached, None
+        # Dashboard click, quick add, and refresh can all want the same
+        # title at once; join the fetch that is already running
+        inflight = self._tmdb_inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_tmdb_details(key, media_type, tmdb_id, token))
+            self._tmdb_inflight[key] = inflight
+            inflight.add_done_callback(lambda _task: self._tmdb_inflight.pop(key, None))
+        return await inflight
+
+    async def _fetch_tmdb_details(self, key, media_type: str, tmdb_id: int, token: str):
         try:
             resp = await self.client.get(f"{self.tmdb_base_url}/{media_type}/{tmdb_id}", headers={"Authorization": f"Bearer {token}"}, params={"append_to_response": "external_ids"})
-            return (resp.json(), None) if resp.status_code == 200 else (None, "Error")
+            if resp.status_code == 200:
+                data = resp.json()
+                self._tmdb_cache_set(key, data)
+                return data, None
+            return None, "Error"
         except Exception as e: return None, str(e)
 
     async def find_tmdb_id(self, external_id: str, source: str, token: str):
+        # External-id mappings never change; cache hits skip the round-trip
+        cache_key = ("find", source, external_id)
+        cached = self._tmdb_cache_get(cache_key, self.TMDB_DETAILS_TTL)
+        if cached is not None:
+            return cached, None
         url = f"{self.tmdb_base_url}/find/{external_id}"
         try:
             resp = await self.client.get(url, headers={"Authorization": f"Bearer {token}"}, params={"external_source": source})
             if resp.status_code == 200:
                 data = resp.json()
                 for key in ["movie_results", "tv_results"]:
-                    if data.get(key): return data[key][0].get("id"), None
+                    if data.get(key):
+                        tmdb_id = data[key][0].get("id")
+                        self._tmdb_cache_set(cache_key, tmdb_id)
+                        return tmdb_id, None
             return None, "Not found"
         except Exception as e: return None, str(e)
 
     async def get_tmdb_trending(self, token: str):
+        key = ("trending",)
+        cached = self._tmdb_cache_get(key, self.TMDB_TRENDING_TTL)
+        if cached is not None:
+            return cached, None
         try:
             resp = await self.client.get(f"{self.tmdb_base_url}/trending/all/day", headers={"Authorization": f"Bearer {token}"})
-            return (resp.json().get("results", []), None) if resp.status_code == 200 else (None, "Error")
+            if resp.status_code == 200:
+                results = resp.json().get("results", [])
+                self._tmdb_cache_set(key, results)
+                return results, None
+            return None, "Error"
         except Exception as e: return None, str(e)
 
+    async def _conditional_get(self, url: str, headers: dict):
+        """GET with If-None-Match so unchanged resources return 304.
+
+        The dashboard polls stats/services/settings every refresh even though
+        they rarely change; a 304 skips the payload transfer and JSON decode
+        and the previously parsed body is returned instead.
+        """
+        cached = self._etags.get(url)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+        resp = await self.client.get(url, headers=headers)
+        if resp.status_code == 304 and cached:
+            # Hand out a copy: SettingsView edits its response in place, and
+            # returning the cached master by reference would replay those
+            # local mutations as server state on every later 304
+            return copy.deepcopy(cached[1]), None
+        if resp.status_code == 200:
+            data = resp.json()
+            etag = resp.headers.get("etag")
+            if etag:
+                self._etags[url] = (etag, copy.deepcopy(data))
+            return data, None
+        return None, f"HTTP {resp.status_code} from {url}"
+
     async def get_stats(self, riven_key: str):
         try:
-            resp = await self.client.get(f"{self.be_base_url}{self.api_base_path}/stats", headers={"x-api-key": str(riven_key)})
-            return (resp.json(), None) if resp.status_code == 200 else (None, "Error")
+            return await self._conditional_get(f"{self.be_base_url}{self.api_base_path}/stats", {"x-api-key": str(riven_key)})
         except Exception as e: return None, str(e)
 
     async def get_tmdb_genres(self, token: str):
@@ -334,8 +498,7 @@ class RivenAPI:
 
     async def get_services(self, riven_key: str):
         try:
-            resp = await self.client.get(f"{self.be_base_url}{self.api_base_path}/services", headers={"x-api-key": str(riven_key)})
-            return (resp.json(), None) if resp.status_code == 200 else (None, "Error")
+            return await self._conditional_get(f"{self.be_base_url}{self.api_base_path}/services", {"x-api-key": str(riven_key)})
         except Exception as e: return None, str(e)
 
     async def get_health(self, riven_key: str):
@@ -360,13 +523,9 @@ class RivenAPI:
         url = f"{base}{self.api_base_path}/settings/get/all"
         
         headers = {"x-api-key": str(riven_key or "")}
-        
+
         try:
-            resp = await self.client.get(url, headers=headers, timeout=self.client.timeout)
-            if resp.status_code == 200:
-                return resp.json(), None
-            # Return the actual status code if it's not 200
-            return None, f"HTTP {resp.status_code} from {url}"
+            return await self._conditional_get(url, headers)
         except Exception as e:
             # Return the actual technical error (Timeout, Connection Refused, etc.)
             return None, f"{type(e).__name__}: {str(e)}"
@@ -155,8 +155,11 @@ class DashboardView(Vertical):
             else:
                 widget.add_class("hidden")
 
-    async def update_service_pills(self, services: dict, settings: dict):
-        SERVICE_MAP = {
+    # Settings path for each service, pre-split once so the periodic refresh
+    # doesn't re-split the same constant strings on every pass
+    SERVICE_MAP = {
+        name: tuple(path.split("."))
+        for name, path in {
             "overseerr": "content.overseerr.enabled", "plex_watchlist": "content.plex_watchlist.enabled",
             "listrr": "content.listrr.enabled", "mdblist": "content.mdblist.enabled",
             "trakt": "content.trakt.enabled", "aiostreams": "scraping.aiostreams.enabled",
@@ -167,22 +170,30 @@ class DashboardView(Vertical):
             "plexupdater": "updaters.plex.enabled", "jellyfin": "updaters.jellyfin.enabled",
             "emby": "updaters.emby.enabled", "realdebrid": "downloaders.real_debrid.enabled",
             "debridlink": "downloaders.debrid_link.enabled", "alldebrid": "downloaders.all_debrid.enabled"
-        }
+        }.items()
+    }
+
+    # Pill widget id per service, derived once instead of re-running the
+    # replace chain for every pill on every refresh pass
+    PILL_IDS = {
+        name: name.replace("watchlist", "wl").replace("realdebrid", "rd").replace("plexupdater", "plex")
+        for name in SERVICE_MAP
+    }
 
-        def get_nested(data, path):
-            parts = path.split(".")
+    async def update_service_pills(self, services: dict, settings: dict):
+        def get_nested(data, parts):
             for p in parts:
                 if isinstance(data, dict): data = data.get(p)
                 else: return None
             return data
 
-        for s_name, s_path in SERVICE_MAP.items():
-            is_enabled = get_nested(settings, s_path) is True
+        for s_name, s_parts in self.SERVICE_MAP.items():
+            is_enabled = get_nested(settings, s_parts) is True
             is_healthy = services.get(s_name) is True
             status = "disabled"
             if is_enabled: status = "healthy" if is_healthy else "unhealthy"
             
-            p_id = s_name.replace("watchlist", "wl").replace("realdebrid", "rd").replace("plexupdater", "plex")
+            p_id = self.PILL_IDS[s_name]
             try:
                 pill = self.query_one(f"#pill-{p_id}", Static)
                 display_name = p_id.upper()
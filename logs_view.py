@@ -4,14 +4,30 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import RichLog, Input, Button, Checkbox
 from textual.reactive import reactive
 from rich.markup import escape
+from functools import lru_cache
 from typing import List
 
+# Loguru's level field is a single token, so one dict get classifies a
+# line instead of scanning it for each level name in turn
+_LEVEL_COLORS = {
+    "ERROR": "red",
+    "WARNING": "yellow",
+    "SUCCESS": "green",
+    "DEBUG": "cyan",
+    "PROGRAM": "magenta",
+}
+
 class LogsView(Vertical):
     filter_query = reactive("")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.displayed_count = 0
+        # Compiled form of filter_query: (negate, needle) pairs, parsed once
+        # per query change instead of once per line
+        self._compiled_terms: List[tuple] = []
+        self._filter_case_sensitive = False
+        self._filter_timer = None
 
     def compose(self) -> ComposeResult:
         # Use a safe default for max_lines, but it will be updated in on_mount from settings
@@ -30,78 +46,92 @@ class LogsView(Vertical):
         max_lines = self.app.settings.get("max_log_lines", 2000)
         self.query_one("#logs-display", RichLog).max_lines = max_lines
 
-    def _matches_filter(self, line: str) -> bool:
-        if not self.filter_query:
-            return True
-        
-        query = self.filter_query
-        # Smart Case: case-sensitive if query has uppercase
-        is_case_sensitive = any(c.isupper() for c in query)
-        
-        terms = query.split()
-        for term in terms:
+    def _compile_filter(self, query: str) -> None:
+        # Smart Case: case-sensitive if query has uppercase. The lower()
+        # round-trip runs in C, unlike a per-character isupper() scan.
+        self._filter_case_sensitive = query != query.lower()
+        terms = []
+        for term in query.split():
             negate = term.startswith("!")
-            search_term = term[1:] if negate else term
-            
-            if not search_term:
+            needle = term[1:] if negate else term
+            if not needle:
                 continue
+            if not self._filter_case_sensitive:
+                needle = needle.lower()
+            terms.append((negate, needle))
+        self._compiled_terms = terms
 
-            if is_case_sensitive:
-                found = search_term in line
-            else:
-                found = search_term.lower() in line.lower()
-            
-            if negate and found:
-                return False
-            if not negate and not found:
+    def _matches_filter(self, line: str) -> bool:
+        terms = self._compiled_terms
+        if not terms:
+            return True
+
+        haystack = line if self._filter_case_sensitive else line.lower()
+        for negate, needle in terms:
+            # A negated term that matches, or a plain term that doesn't,
+            # both reject the line
+            if (needle in haystack) == negate:
                 return False
-        
         return True
 
-    def _style_line(self, line: str) -> str:
-        styled_line = escape(line)
-        if "|" in line:
-            parts = line.split("|", 2)
-            if len(parts) >= 2:
-                level_part = parts[1].strip()
-                color = "white"
-                if "ERROR" in level_part: color = "red"
-                elif "WARNING" in level_part: color = "yellow"
-                elif "SUCCESS" in level_part: color = "green"
-                elif "DEBUG" in level_part: color = "cyan"
-                elif "PROGRAM" in level_part: color = "magenta"
-                
-                p0 = escape(parts[0])
-                p1 = escape(parts[1])
-                
-                if len(parts) == 3:
-                    p2 = escape(parts[2])
-                    styled_line = f"{p0} | [bold {color}]{p1}[/] |{p2}"
-                else:
-                    styled_line = f"{p0} | [bold {color}]{p1}[/]"
-        return styled_line
+    # Log lines are immutable, so the escape + markup work is memoized;
+    # filter rebuilds then re-style each line with a dict hash
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _style_line(line: str) -> str:
+        # partition returns a fixed tuple instead of allocating a list, and
+        # the separator fields replace the part-count branching
+        head, sep1, rest = line.partition("|")
+        if not sep1:
+            return escape(line)
+
+        level, sep2, tail = rest.partition("|")
+        level_tokens = level.split()
+        color = _LEVEL_COLORS.get(level_tokens[0], "white") if level_tokens else "white"
+
+        p0 = escape(head)
+        p1 = escape(level)
+
+        if sep2:
+            return f"{p0} | [bold {color}]{p1}[/] |{escape(tail)}"
+        return f"{p0} | [bold {color}]{p1}[/]"
 
     def watch_filter_query(self, new_query: str) -> None:
+        self._compile_filter(new_query)
         log_widget = self.query_one("#logs-display", RichLog)
         log_widget.clear()
-        for line in self.app.global_logs:
-            if "GET /api/v1/logs" in line:
-                continue
-            if self._matches_filter(line):
-                log_widget.write(self._style_line(line))
+        to_write = [
+            self._style_line(line)
+            for line in self.app.global_logs
+            if self._matches_filter(line)
+        ]
+        if to_write:
+            # One multi-line write = one markup parse and one refresh
+            log_widget.write("\n".join(to_write))
 
     @on(Input.Changed, "#logs-filter-input")
     def on_filter_changed(self, event: Input.Changed) -> None:
-        self.filter_query = event.value.strip()
+        # Trailing debounce so rapid typing collapses into one rebuild of
+        # the RichLog instead of a clear-and-rewrite per keystroke
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        value = event.value.strip()
+        self._filter_timer = self.set_timer(0.15, lambda: self._apply_filter(value))
+
+    def _apply_filter(self, value: str) -> None:
+        self._filter_timer = None
+        self.filter_query = value
 
     def process_new_global_logs(self, new_lines: List[str]):
         """Called by the main app when new lines are added to global_logs."""
         log_widget = self.query_one("#logs-display", RichLog)
-        for line in new_lines:
-            if "GET /api/v1/logs" in line:
-                continue
-            if self._matches_filter(line):
-                log_widget.write(self._style_line(line))
+        to_write = [
+            self._style_line(line)
+            for line in new_lines
+            if self._matches_filter(line)
+        ]
+        if to_write:
+            log_widget.write("\n".join(to_write))
 
     async def update_logs(self, refresh_all: bool = False):
         """Refreshes the view from the app's global_logs."""
@@ -112,11 +142,13 @@ class LogsView(Vertical):
             # Always force fetch on manual refresh
             await self.app.fetch_logs_worker(force=True)
                 
-            for line in self.app.global_logs:
-                if "GET /api/v1/logs" in line:
-                    continue
-                if self._matches_filter(line):
-                    log_widget.write(self._style_line(line))
+            to_write = [
+                self._style_line(line)
+                for line in self.app.global_logs
+                if self._matches_filter(line)
+            ]
+            if to_write:
+                log_widget.write("\n".join(to_write))
         else:
             # Manual refresh also triggers a worker run to be sure
             await self.app.fetch_logs_worker(force=True)
@@ -128,7 +160,7 @@ class LogsView(Vertical):
     @on(Button.Pressed, "#btn-logs-clear")
     def handle_clear(self):
         self.query_one("#logs-display", RichLog).clear()
-        self.app.global_logs = []
+        self.app.global_logs.clear()
 
     @on(Checkbox.Changed, "#cb-logs-auto-refresh")
     def handle_auto_refresh(self, event: Checkbox.Changed):
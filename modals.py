@@ -1,8 +1,10 @@
 import json
 import asyncio
+import contextlib
 import os
 import sys
 import time
+from collections import defaultdict, deque
 from typing import List, Optional
 from textual import on
 from textual.app import ComposeResult
@@ -17,6 +19,14 @@ from version import VERSION
 from api import RivenAPI
 from messages import RefreshPoster
 
+# orjson decodes the high-rate SSE discovery events ~2-3x faster than the
+# stdlib; fall back silently when it isn't installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class ConfirmationScreen(ModalScreen[bool]):
     def __init__(self, title: str, message: str, confirm_label: str = "Confirm", cancel_label: str = "Cancel", variant: str = "primary"):
         super().__init__(classes="centered-modal-screen")
@@ -89,35 +99,52 @@ class UpdateScreen(ModalScreen[bool]):
         base_dir = getattr(self.app, "BASE_DIR", os.getcwd())
         
         try:
-            # Sequence: Fetch -> Hard Reset (to overwrite local changes) -> Pull -> Install Deps
+            # Sequence: Fetch -> Hard Reset (to overwrite local changes) -> Install Deps.
+            # A pull after fetch+reset was redundant; dropping it saves a
+            # whole subprocess on the critical UI path.
             steps = [
+                # No --progress: its CR-separated updates can exceed the
+                # stream reader's line limit since stderr is merged into the
+                # streamed stdout; git omits it anyway when stderr isn't a tty
                 ("Fetching latest code...", ["git", "fetch", "--all"]),
-                ("Cleaning local files...", ["git", "reset", "--hard", "origin/main"]),
-                ("Pulling updates...", ["git", "pull", "origin", "main"]),
+                ("Applying update...", ["git", "reset", "--hard", "origin/main"]),
                 ("Updating dependencies...", [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]),
             ]
-            
+
             step_increment = 100 / len(steps)
-            
-            for i, (msg, cmd) in enumerate(steps):
+
+            for msg, cmd in steps:
                 details.update(f"[yellow]{msg}[/]")
-                
+
                 # FIXED: Added 'cwd=base_dir' to ensure git runs in the right folder
                 process = await asyncio.create_subprocess_exec(
                     *cmd,
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
                     cwd=base_dir
                 )
-                stdout, stderr = await process.communicate()
-                
+                # Drain output as it arrives instead of buffering it all with
+                # communicate(); memory stays bounded to the last few lines
+                # and the bar creeps during long steps instead of jumping
+                # once per subprocess
+                tail = deque(maxlen=8)
+                advanced = 0.0
+                async for line in process.stdout:
+                    text = line.decode(errors="ignore").strip()
+                    if text:
+                        tail.append(text)
+                        details.update(f"[yellow]{msg}[/]\n[dim]{text}[/]")
+                    if advanced < step_increment * 0.8:
+                        bar.advance(step_increment * 0.05)
+                        advanced += step_increment * 0.05
+                await process.wait()
+
                 if process.returncode != 0:
-                    # If reset fails, try to continue, but if pull fails, we stop
-                    err_text = stderr.decode().strip()
-                    if "pull" in cmd or "fetch" in cmd:
-                        raise Exception(f"Git Error: {err_text}")
-                
-                bar.advance(step_increment)
+                    # pip hiccups are tolerable; a failed fetch or reset is not
+                    if cmd[0] == "git":
+                        raise Exception(f"Git Error: {' / '.join(tail)}")
+
+                bar.advance(step_increment - advanced)
 
             details.update("[bold green]Update successful![/]\n[cyan]Restarting application...")
             await asyncio.sleep(2)
@@ -144,23 +171,21 @@ class MediaCardScreen(ModalScreen):
         self.settings = settings
         self.chafa_available = chafa_available
         self.post_message_debounce_timer = None
-
-    def compose(self) -> ComposeResult:
-        with Vertical(id="modal-media-card"):
-            yield Vertical(id="modal-media-container")
-            yield Vertical(id="modal-json-container", classes="hidden")
-            yield Button("Back to Media", id="btn-back-from-json", variant="primary", classes="hidden")
-
-    async def on_mount(self):
-        self.app.log_message("[MEDIA CARD FLOW] 4. MediaCardScreen.on_mount started.")
-        container = self.query_one("#modal-media-container")
+        # Set once the poster widget is mounted; lets resize/refresh handlers
+        # bail out without re-running queries on poster-less cards
+        self.poster_widget: Optional[Static] = None
+        # Pure-Python field extraction runs on the caller's turn, before
+        # push_screen, so on_mount stays on the paint path only for mounting
+        self._extract_display_fields()
+
+    def _extract_display_fields(self) -> None:
         tmdb_data = self.tmdb_data
         riven_data = self.riven_data
-        
-        title = tmdb_data.get('title') or tmdb_data.get('name', 'N/A')
+
+        self._title = tmdb_data.get('title') or tmdb_data.get('name', 'N/A')
         year = (tmdb_data.get('release_date') or tmdb_data.get('first_air_date', 'N/A'))[:4]
-        tagline = tmdb_data.get('tagline')
-        
+        self._tagline = tmdb_data.get('tagline')
+
         runtime_movie = tmdb_data.get('runtime', 0)
         episode_run_time = None
         if self.media_type == "tv":
@@ -168,48 +193,54 @@ class MediaCardScreen(ModalScreen):
             if episode_run_time_list:
                 episode_run_time = f"{episode_run_time_list[0]} mins"
 
-        genres = " - ".join([genre.get('name') for genre in tmdb_data.get('genres', []) if genre.get('name')])
-        description = tmdb_data.get('overview')
+        self._genres = " - ".join([genre.get('name') for genre in tmdb_data.get('genres', []) if genre.get('name')])
+        self._description = tmdb_data.get('overview')
         status = tmdb_data.get('status')
-        
+
         languages_spoken_list =[lang.get('iso_639_1').upper() for lang in tmdb_data.get('spoken_languages', []) if lang.get('iso_639_1')]
         if not languages_spoken_list and tmdb_data.get('original_language'):
             languages_spoken_list.append(tmdb_data.get('original_language').upper())
         languages_spoken = " - ".join(languages_spoken_list)
 
-        # Create Split Layout
-        split_layout = Horizontal(classes="media-detail-layout")
-        await container.mount(split_layout)
-        
-        info_col = Vertical(classes="media-info-column")
-        action_col = Vertical(classes="media-action-column")
-        await split_layout.mount(info_col)
-        await split_layout.mount(action_col)
-
-        # 1. Populate Info Column (Left)
-        await info_col.mount(Static(f"[bold]{title}[/bold]", classes="media-title"))
-        if tagline:
-            await info_col.mount(Static(f"[italic]{tagline}[/italic]", classes="media-tagline"))
-
         meta_items = [year]
         if self.media_type == "movie" and runtime_movie:
             meta_items.append(f"{runtime_movie} mins")
         elif self.media_type == "tv" and episode_run_time:
             meta_items.append(episode_run_time)
-            
+
         if languages_spoken:
             meta_items.append(languages_spoken)
         if status:
             meta_items.append(status)
         if riven_data:
             meta_items.append(f"[bold]{riven_data.get('state', 'Unknown').title()}[/]")
-            
-        await info_col.mount(Static(" • ".join(filter(None, meta_items)), classes="media-metadata"))
+        self._metadata = " • ".join(filter(None, meta_items))
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="modal-media-card"):
+            yield Vertical(id="modal-media-container")
+            yield Vertical(id="modal-json-container", classes="hidden")
+            yield Button("Back to Media", id="btn-back-from-json", variant="primary", classes="hidden")
+
+    async def on_mount(self):
+        self.app.log_message("[MEDIA CARD FLOW] 4. MediaCardScreen.on_mount started.")
+        container = self.query_one("#modal-media-container")
+        riven_data = self.riven_data
+
+        # Build the whole split layout in memory first and mount it in one
+        # batch; each awaited mount otherwise pays its own layout pass
+
+        # 1. Populate Info Column (Left)
+        info_children = [Static(f"[bold]{self._title}[/bold]", classes="media-title")]
+        if self._tagline:
+            info_children.append(Static(f"[italic]{self._tagline}[/italic]", classes="media-tagline"))
 
-        if genres:
-            await info_col.mount(Static(genres, classes="media-genres"))
-        if description:
-            await info_col.mount(Static(description, classes="media-overview"))
+        info_children.append(Static(self._metadata, classes="media-metadata"))
+
+        if self._genres:
+            info_children.append(Static(self._genres, classes="media-genres"))
+        if self._description:
+            info_children.append(Static(self._description, classes="media-overview"))
 
         # 2. Populate Action Column (Right)
         action_buttons =[]
@@ -228,25 +259,39 @@ class MediaCardScreen(ModalScreen):
         action_buttons.append(Button("Back", id="btn-back-to-dashboard", variant="primary"))
         action_buttons.append(Button("JSON", id="btn-print-json-modal"))
         
-        await action_col.mount(Horizontal(*action_buttons, id="modal-button-row", classes="media-button-bar"))
+        action_children = [Horizontal(*action_buttons, id="modal-button-row", classes="media-button-bar")]
+
+        if self.chafa_available and self.tmdb_data.get("poster_path"):
+            self.poster_widget = Static(id="poster-display-modal")
+            action_children.append(self.poster_widget)
+
+        await container.mount(Horizontal(
+            Vertical(*info_children, classes="media-info-column"),
+            Vertical(*action_children, classes="media-action-column"),
+            classes="media-detail-layout",
+        ))
 
         self.app.log_message("[MEDIA CARD FLOW] 5. UI Elements mounted. Setting RefreshPoster timer.")
-        if self.chafa_available and tmdb_data.get("poster_path"):
-            await action_col.mount(Static(id="poster-display-modal"))
+        if self.poster_widget is not None:
             self.last_chafa_width = None
             self.set_timer(0.1, lambda: self.post_message(RefreshPoster()))
 
         self.app.log_message("[MEDIA CARD FLOW] 6. MediaCardScreen.on_mount finished.")
 
     async def on_resize(self, event) -> None:
+        # Gate on the cached widget instead of re-checking chafa/poster_path
+        # and querying the DOM on every resize tick
+        if self.poster_widget is None:
+            return
         self.app.log_message(f"[MEDIA CARD FLOW] Resize Event Triggered: {event.size}")
-        if self.chafa_available and self.tmdb_data.get("poster_path"):
-            if self.post_message_debounce_timer:
-                self.post_message_debounce_timer.stop()
-            self.post_message_debounce_timer = self.set_timer(0.2, lambda: self.post_message(RefreshPoster()))
+        if self.post_message_debounce_timer:
+            self.post_message_debounce_timer.stop()
+        self.post_message_debounce_timer = self.set_timer(0.2, lambda: self.post_message(RefreshPoster()))
 
     @on(RefreshPoster)
     async def on_refresh_poster(self, message: RefreshPoster) -> None:
+        if self.poster_widget is None:
+            return
         self.app.log_message("[MEDIA CARD FLOW] 7. RefreshPoster message received. Starting worker.")
         # We removed the cancellation kill-switch because it was assassinating the worker!
         self.run_worker(self._perform_poster_load())
@@ -254,11 +299,10 @@ class MediaCardScreen(ModalScreen):
     async def _perform_poster_load(self) -> None:
         start_time = time.time()
         self.app.log_message("[MEDIA CARD FLOW] 8. _perform_poster_load worker started.")
-        
-        try:
-            poster_widget = self.query_one("#poster-display-modal", Static)
-        except NoMatches:
-            self.app.log_message("[MEDIA CARD FLOW] ERROR: Could not find poster-display-modal widget.")
+
+        poster_widget = self.poster_widget
+        if poster_widget is None:
+            self.app.log_message("[MEDIA CARD FLOW] ERROR: Poster widget was never mounted.")
             return
 
         target_width = None
@@ -326,14 +370,27 @@ class MediaCardScreen(ModalScreen):
         json_container = self.query_one("#modal-json-container")
         back_btn = self.query_one("#btn-back-from-json")
 
-        await json_container.query("*").remove()
-        formatted_json = json.dumps(data, indent=4)
-        await json_container.mount(Static(formatted_json))
+        # remove_children detaches the subtree in one shot instead of walking
+        # it into a NodeList and removing node by node
+        await json_container.remove_children()
+        # Extended item payloads can be large; serialize off the event loop
+        formatted_json = await asyncio.to_thread(json.dumps, data, indent=4)
 
         media_container.add_class("hidden")
         json_container.remove_class("hidden")
         back_btn.remove_class("hidden")
 
+        # A season-heavy show can dump 100KB+ of JSON; mounting it as one
+        # Static measures the whole block in a single pass. Stream it in
+        # 200-line chunks so the first screenful is scrollable immediately,
+        # and stop early if the user backs out mid-dump.
+        lines = formatted_json.split("\n")
+        for start in range(0, len(lines), 200):
+            if json_container.has_class("hidden"):
+                break
+            json_container.mount(Static("\n".join(lines[start:start + 200])))
+            await asyncio.sleep(0)
+
     @on(Button.Pressed, "#btn-back-from-json")
     def handle_back_from_json(self):
         self.query_one("#modal-media-container").remove_class("hidden")
@@ -480,6 +537,12 @@ class ScrapeLogScreen(ModalScreen[dict]):
         self.riven_item_id = riven_item_id
         self.tvdb_id = tvdb_id
         self.all_streams = {}
+        # Set when the screen goes away so the discovery loop stops draining
+        # and decoding events nobody is watching
+        self._cancelled = False
+
+    def on_unmount(self) -> None:
+        self._cancelled = True
 
     def compose(self) -> ComposeResult:
         with Vertical(id="scrape-log-container", classes="modal-popup"):
@@ -541,32 +604,65 @@ class ScrapeLogScreen(ModalScreen[dict]):
 
         # --- PHASE 4: STREAMING ---
         log_widget.write_line("\n[bold cyan]Phase 3: Discovery Stream[/]")
+
+        # Chatty scrapers emit hundreds of SSE events per run; buffering the
+        # messages and flushing in batches keeps the Log widget at ~10 repaints
+        # per second instead of one per event.
+        msg_buf: List[str] = []
+        last_flush = time.monotonic()
+
+        def flush():
+            nonlocal last_flush
+            if msg_buf:
+                log_widget.write_lines(msg_buf)
+                msg_buf.clear()
+            last_flush = time.monotonic()
+
+        # Local bindings for the per-event loop; attribute lookups add up at
+        # hundreds of messages per second
+        all_streams = self.all_streams
+
         try:
-            async for line in self.app.api.scrape_stream(
-                self.media_type, self.tmdb_id, self.riven_key, 
+            # aclosing shuts the HTTP connection down promptly when we bail,
+            # freeing the server side instead of letting it keep scraping
+            async with contextlib.aclosing(self.app.api.scrape_stream(
+                self.media_type, self.tmdb_id, self.riven_key,
                 item_id=self.riven_item_id, tvdb_id=self.tvdb_id, overrides=overrides
-            ):
-                # Your logs show lines like 'data: {"event":"streams", ...}'
-                if line.startswith("data:"):
-                    raw = line[5:].strip()
-                    if raw == "[DONE]": break
-                    try:
-                        msg = json.loads(raw)
-                        # Riven sends 'message' describing which service found what
-                        if 'message' in msg: 
-                            log_widget.write_line(f"-> {msg['message']}")
-                        
-                        # Accumulate streams into the results
-                        if 'streams' in msg and msg['streams']:
-                            self.all_streams.update(msg['streams'])
-                            
-                        if msg.get("event") == "complete": 
-                            break
-                    except: 
-                        continue
-                elif line.startswith("error:"):
-                    log_widget.write_line(f"[bold red]BACKEND ERROR:[/] {line}")
-
+            )) as stream:
+                async for line in stream:
+                    if self._cancelled:
+                        break
+                    # Your logs show lines like 'data: {"event":"streams", ...}'
+                    if line[:5] == "data:":
+                        # aiter_lines already strips terminators; only the space
+                        # after the SSE prefix is left to drop
+                        raw = line[5:].lstrip()
+                        if raw == "[DONE]": break
+                        # C-level substring scans are far cheaper than a JSON
+                        # decode; skip payloads carrying nothing we act on
+                        if "streams" not in raw and "message" not in raw and "complete" not in raw:
+                            continue
+                        try:
+                            msg = _json_loads(raw)
+                            # Riven sends 'message' describing which service found what
+                            if 'message' in msg:
+                                msg_buf.append(f"-> {msg['message']}")
+
+                            # Accumulate streams into the results
+                            if 'streams' in msg and msg['streams']:
+                                all_streams.update(msg['streams'])
+
+                            if msg.get("event") == "complete":
+                                break
+                        except:
+                            continue
+                        if len(msg_buf) >= 16 or time.monotonic() - last_flush > 0.1:
+                            flush()
+                    elif line.startswith("error:"):
+                        flush()
+                        log_widget.write_line(f"[bold red]BACKEND ERROR:[/] {line}")
+
+            flush()
             log_widget.write_line(f"\n[bold green]Complete![/] Found {len(self.all_streams)} streams.")
             
             if self.all_streams:
@@ -576,6 +672,7 @@ class ScrapeLogScreen(ModalScreen[dict]):
                 log_widget.write_line("[yellow]No streams found. Check indexer settings.[/]")
 
         except Exception as e:
+            flush()
             log_widget.write_line(f"[bold red]Critical stream failure:[/] {e}")
 
     @on(Button.Pressed, "#btn-close-scrape-log")
@@ -595,24 +692,27 @@ class StreamSelectionScreen(ModalScreen[str]):
 
     def on_mount(self) -> None:
         lv = self.query_one(ListView)
+        # Text.assemble skips the markup tokenizer (and the escape() it
+        # forces); scrapes can return hundreds of streams
+        items = []
         for stream in self.streams:
-            raw_title = escape(stream.get('raw_title', 'Unknown Stream'))
+            raw_title = stream.get('raw_title', 'Unknown Stream')
             resolution = stream.get('resolution', 'N/A')
             rank = stream.get('rank', 'N/A')
-            
-            label_text = f"{raw_title} (Res: {resolution}, Rank: {rank})"
+            failed = stream.get('failed')
 
-            if stream.get('failed'):
-                label_text = f"[s]{label_text}[/s]"
-            
-            label = Label(Text.from_markup(label_text))
+            label = Label(Text.assemble(
+                (f"{raw_title} (Res: {resolution}, Rank: {rank})", "strike" if failed else "")
+            ))
             list_item = ListItem(label)
             list_item.stream_data = stream
 
-            if stream.get('failed'):
+            if failed:
                 list_item.disabled = True
-            
-            lv.append(list_item)
+
+            items.append(list_item)
+        # One extend amortizes the ListView refresh across all rows
+        lv.extend(items)
 
 
     @on(ListView.Selected)
@@ -634,100 +734,102 @@ class FileMappingScreen(ModalScreen[dict]):
     def __init__(self, files: List[dict], parsed_data: List[dict], title: str, session_id: str, name: str | None = None, id: str | None = None, classes: str | None = None) -> None:
         super().__init__(name=name, id=id, classes=f"{classes or ''} centered-modal-screen".strip())
         self.files = files
-        self.parsed_map = {p['raw_title']: p for p in parsed_data if 'raw_title' in p}
         self.title = title
         self.session_id = session_id
 
+        # Index parsed results by filename (falling back to raw_title, which
+        # is what the parse endpoint echoes back) and precompute the initial
+        # season/episode strings once, instead of dict lookups per row on mount.
+        by_name = {p.get('filename') or p.get('raw_title'): p for p in parsed_data}
+        self._initial_mapping = []
+        for f in files:
+            parsed = by_name.get(f.get('filename'), {})
+            season = str(parsed['seasons'][0]) if parsed.get('seasons') else ""
+            episode = str(parsed['episodes'][0]) if parsed.get('episodes') else ""
+            self._initial_mapping.append((season, episode))
+
+        # (row, season_input, episode_input) per file, captured at compose
+        # time so mount/confirm iterate refs instead of walking the DOM
+        self._rows: List[tuple] = []
+
     def compose(self) -> ComposeResult:
         with Vertical(id="file-mapping-container", classes="modal-container modal-popup"):
             yield Static(f"Map Files for: [bold]{self.title}[/bold]", id="file-mapping-title")
             
             with Vertical(id="file-mapping-list", classes="scrollable-container"):
                 for i, file_info in enumerate(self.files):
-                    with Horizontal(classes="file-mapping-item"):
+                    # Seed the inputs at construction; assigning .value after
+                    # mount would fire a change watcher and re-render per row
+                    season, episode = self._initial_mapping[i]
+                    row = Horizontal(classes="file-mapping-item")
+                    row.file_data = file_info
+                    season_input = Input(
+                        value=season,
+                        placeholder="S", 
+                        id=f"season-input-{i}", 
+                        classes="season-episode-input"
+                    )
+                    episode_input = Input(
+                        value=episode,
+                        placeholder="E", 
+                        id=f"episode-input-{i}", 
+                        classes="season-episode-input"
+                    )
+                    self._rows.append((row, season_input, episode_input))
+                    with row:
                         yield Label(file_info.get("filename", "Unknown file"), classes="filename-label")
-                        yield Input(
-                            placeholder="S", 
-                            id=f"season-input-{i}", 
-                            classes="season-episode-input"
-                        )
-                        yield Input(
-                            placeholder="E", 
-                            id=f"episode-input-{i}", 
-                            classes="season-episode-input"
-                        )
+                        yield season_input
+                        yield episode_input
             
             with Horizontal(id="file-mapping-buttons", classes="button-bar"):
                 yield Button("Confirm", id="btn-confirm-mapping", variant="success")
                 yield Button("Cancel", id="btn-cancel-mapping", variant="primary")
                 yield Button("Abort Session", id="btn-abort-session", variant="error")
 
-    def on_mount(self) -> None:
-        for i, item_container in enumerate(self.query(".file-mapping-item")):
-            item_container.file_data = self.files[i]
-            
-            file_info = self.files[i]
-            filename = file_info.get("filename", "Unknown file")
-            parsed = self.parsed_map.get(filename, {})
-
-            season = ""
-            if "seasons" in parsed and parsed["seasons"]:
-                season = str(parsed["seasons"][0])
-            
-            episode = ""
-            if "episodes" in parsed and parsed["episodes"]:
-                episode = str(parsed["episodes"][0])
-
-            season_input = item_container.query_one(f"#season-input-{i}", Input)
-            episode_input = item_container.query_one(f"#episode-input-{i}", Input)
-
-            season_input.value = season
-            episode_input.value = episode
-
     @on(Button.Pressed, "#btn-confirm-mapping")
-    def on_confirm_mapping(self, event: Button.Pressed) -> None: 
-        mapping = {}
+    def on_confirm_mapping(self, event: Button.Pressed) -> None:
+        mapping: dict = defaultdict(dict)
         has_error = False
-        for i, item_container in enumerate(self.query(".file-mapping-item")):
-            season_input = self.query_one(f"#season-input-{i}", Input)
-            episode_input = self.query_one(f"#episode-input-{i}", Input)
-            
+        for row, season_input, episode_input in self._rows:
             season_str = season_input.value.strip()
             episode_str = episode_input.value.strip()
 
             if not season_str and not episode_str:
                 continue
 
-            try:
-                season = int(season_str)
-                episode = int(episode_str)
-                season_input.remove_class("input-error")
-                episode_input.remove_class("input-error")
-            except ValueError:
+            # Validate up front: cheaper than raising/unwinding ValueError per
+            # bad row when users paste non-numeric data in bulk. isdecimal()
+            # matches exactly what int() accepts, unlike isdigit(), which also
+            # passes superscripts and circled digits that int() rejects.
+            season_ok = season_str.isdecimal()
+            episode_ok = episode_str.isdecimal()
+            if not (season_ok and episode_ok):
                 self.app.notify("Invalid season or episode number. Please enter valid integers.", severity="error")
-                if not season_str.isdigit():
+                if not season_ok:
                     season_input.add_class("input-error")
-                if not episode_str.isdigit():
+                if not episode_ok:
                     episode_input.add_class("input-error")
                 has_error = True
                 continue
 
-            if str(season) not in mapping:
-                mapping[str(season)] = {}
-            
-            file_data = item_container.file_data
-            mapping[str(season)][str(episode)] = {
+            season = str(int(season_str))
+            episode = str(int(episode_str))
+            season_input.remove_class("input-error")
+            episode_input.remove_class("input-error")
+
+            file_data = row.file_data
+            mapping[season][episode] = {
                 "file_id": file_data.get("file_id"),
                 "filename": file_data.get("filename"),
                 "filesize": file_data.get("filesize"),
                 "download_url": file_data.get("download_url")
             }
-        
+
         if not has_error:
             if not mapping:
                 self.app.notify("No files were mapped. Please map at least one file.", severity="warning")
             else:
-                self.dismiss(mapping)
+                self.dismiss(dict(mapping))
 
     @on(Button.Pressed, "#btn-cancel-mapping")
     def on_cancel_mapping(self, event: Button.Pressed) -> None: 
@@ -1,14 +1,19 @@
 import json
+import re
 import asyncio
 import os
 import gc
 import math
 import calendar
 from datetime import datetime
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Optional, Literal, Dict
 import time
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue
 import shutil
 from textual import on
 from textual.app import App, ComposeResult
@@ -46,6 +51,25 @@ from modals import (
 import httpx
 
 NOTIFICATION_CLEAR_DELAY = 3.0 # Seconds
+LIBRARY_PAGE_CACHE_TTL = 300.0 # Seconds
+
+# calendar.month_name is a lazy locale-aware sequence that builds a fresh
+# string per index; snapshot it once for the calendar hot paths
+_MONTH_NAMES = tuple(calendar.month_name)
+
+# Matches VERSION = "1.2.3" or VERSION='1.2.3' in the remote version.py
+_VERSION_RE = re.compile(r'VERSION\s*=\s*["\']([^"\']+)["\']')
+
+# orjson serializes large item payloads several times faster than the
+# stdlib; fall back silently when it isn't installed
+try:
+    import orjson
+
+    def _json_dumps(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(data) -> str:
+        return json.dumps(data, indent=2)
 
 # Ensure we work from any directory by using absolute paths relative to this script
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -62,16 +86,25 @@ class TitleSpinner:
         self.base_title = base_title
         self._spinner_task = None
         self._frame_index = 0
+        self._frames: List[str] = []
+        self._frames_title = None
         self.title_widget = self.app.query_one("#header-title", Static)
 
+    def _build_frames(self):
+        # Pre-render all 8 full title strings so the 10 Hz tick is just an
+        # index + update() with no f-string formatting in the hot path.
+        self._frames = [f"{self.base_title} - {self.message} {c}" for c in self.SPINNER_FRAMES]
+        self._frames_title = self.base_title
+
     async def start(self, message: str = "Loading...", interval: float = DEFAULT_INTERVAL):
         self.stop()
         self._frame_index = 0
         self.message = message
+        self._build_frames()
         self._spinner_task = self.app.set_interval(
             interval, self._update_spinner, name="title_spinner_task"
         )
-        self.title_widget.update(f"{self.base_title} - {self.message} {self.SPINNER_FRAMES[self._frame_index]}")
+        self.title_widget.update(self._frames[self._frame_index])
 
     def stop(self):
         if self._spinner_task:
@@ -80,8 +113,11 @@ class TitleSpinner:
         self.title_widget.update(self.base_title)
 
     def _update_spinner(self):
-        self._frame_index = (self._frame_index + 1) % len(self.SPINNER_FRAMES)
-        self.title_widget.update(f"{self.base_title} - {self.message} {self.SPINNER_FRAMES[self._frame_index]}")
+        if self._frames_title != self.base_title:
+            # base_title can change mid-spin via watch_base_title
+            self._build_frames()
+        self._frame_index = (self._frame_index + 1) & 7
+        self.title_widget.update(self._frames[self._frame_index])
 
 
 class MainContent(Vertical):
@@ -109,9 +145,18 @@ class MainContent(Vertical):
 
     async def display_logs(self, logs: str):
         container = self.query_one("#main-content-container")
-        await container.query("*").remove()
-        await container.mount(Static(logs, id="log-content", expand=True))
-        await container.mount(Button("Refresh", id="btn-refresh-logs", variant="primary"))
+        try:
+            # Refreshes update the mounted Static in place; tearing the view
+            # down just to remount identical chrome forces a full layout pass
+            container.query_one("#log-content", Static).update(logs)
+            return
+        except NoMatches:
+            pass
+        await container.remove_children()
+        await container.mount(
+            Static(logs, id="log-content", expand=True),
+            Button("Refresh", id="btn-refresh-logs", variant="primary"),
+        )
 
     async def display_json(self, data: dict):
         container = self.query_one("#main-content-container")
@@ -119,8 +164,9 @@ class MainContent(Vertical):
         json_container = self.query_one("#main-content-json-container")
         back_btn = self.query_one("#btn-back-to-actions")
 
-        await json_container.query("*").remove()
-        formatted_json = json.dumps(data, indent=4)
+        await json_container.remove_children()
+        # Extended item payloads can be large; serialize off the event loop
+        formatted_json = await asyncio.to_thread(_json_dumps, data)
         await json_container.mount(Static(formatted_json))
 
         container.add_class("hidden")
@@ -186,12 +232,14 @@ class MenuButton(Static):
         if self.app.app_state == state and state in ["dashboard", "library", "calendar", "settings"]:
             self.app.log_message(f"Header: Re-clicked {state}, triggering refresh")
             if state == "dashboard":
-                self.app.run_worker(self.app.refresh_dashboard())
+                self.app.schedule_dashboard_refresh()
             elif state == "library":
+                # Explicit refresh gesture: bypass the page cache like the
+                # calendar re-click does
                 if self.app.last_library_filters:
-                    self.app.run_worker(self.app.show_library_items(**self.app.last_library_filters))
+                    self.app.run_worker(self.app.show_library_items(**self.app.last_library_filters, refresh_cache=True))
                 else:
-                    self.app.run_worker(self.app.show_library_items())
+                    self.app.run_worker(self.app.show_library_items(refresh_cache=True))
             elif state == "calendar":
                 self.app.run_worker(self.app.show_calendar(refresh_cache=True))
             elif state == "settings":
@@ -213,7 +261,9 @@ class RivenTUI(App):
     current_calendar_date = reactive(datetime.now())
     calendar_filters = reactive({"movie": True, "episode": True, "show": True, "season": True})
     background_logs_enabled = reactive(False)
-    global_logs: List[str] = []
+    # Bounded in fetch_logs_worker once settings are known; deque eviction
+    # is O(1) per append instead of re-slicing a list copy
+    global_logs: deque = deque()
 
     def __init__(self):
         super().__init__()
@@ -225,27 +275,78 @@ class RivenTUI(App):
         except:
             pass
 
-        self.previous_logs = ""
+        # Cached copy of the Riven API key; invalidated whenever settings
+        # change so button handlers skip repeated dict lookups
+        self._riven_key_cache: Optional[str] = None
+
+        # Displayed log lines plus the line count of the last upload, so a
+        # refresh only appends the new tail instead of rebuilding the body
+        self._log_buffer: List[str] = []
+        self._previous_log_line_count = 0
         self.chafa_available = False
-        self.post_message_debounce_timer = None 
+        self.post_message_debounce_timer = None
+        # Coalesce poster refreshes: messages arriving while a chafa render
+        # runs collapse into a single trailing re-render
+        self._refresh_poster_inflight = False
+        self._refresh_poster_queued = False
+        # Long-lived client for the periodic GitHub update check; keeps the
+        # TLS connection warm instead of handshaking per check
+        self._update_check_client = httpx.AsyncClient(timeout=10.0, follow_redirects=True)
         self.background_logs_timer: Optional[Timer] = None
+        self._dashboard_refresh_timer: Optional[Timer] = None
+        # Trailing-edge debounce for the delayed item-card refresh; rapid
+        # action sequences collapse into the last scheduled refresh
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_deadline: float = 0.0
+        # Trailing-edge debounce state for pagination and calendar navigation
+        self._library_nav_timer: Optional[Timer] = None
+        self._library_nav_page: Optional[int] = None
+        self._calendar_nav_timer: Optional[Timer] = None
+        # Monotonic sequence numbers; a render bumps its counter on entry and
+        # bails after awaits if a newer render has superseded it
+        self._library_render_seq = 0
+        self._calendar_render_seq = 0
         
         self.logger = logging.getLogger("Riven")
         self.tui_logger = logging.getLogger("Riven.TUI")
         self.tui_logger.propagate = True
+        self._log_listener: Optional[QueueListener] = None
         
         self.spinner = None
         self._clear_notification_timer = None
         self.refresh_delay_seconds = 3.0
         self.last_library_filters = {}
         self.library_selection: Dict[str, str] = {} # ID -> Title
-        self.calendar_cache: List[dict] = [] 
+        # Enriched library pages keyed by filter tuple so page flips back and
+        # forth don't re-fetch and re-enrich identical results
+        self._library_page_cache: Dict[tuple, tuple] = {}
+        # Long-lived top-level widgets resolved once on first state change
+        self._state_widgets: Optional[Dict[str, object]] = None
+        # Currently highlighted header tab; state switches then only touch
+        # the outgoing and incoming buttons
+        self._active_menu_button: Optional[MenuButton] = None
+        # MainContent/Sidebar resolved lazily and reused; every button handler
+        # otherwise pays a DOM walk per press
+        self._main_content: Optional[MainContent] = None
+        self._sidebar: Optional[Sidebar] = None
+        self.calendar_cache: List[dict] = []
+        # Items bucketed by (year, month) so month navigation doesn't rescan
+        # the whole cache
+        self.calendar_month_index: Dict[tuple, List[dict]] = {}
         self.navigation_source: Literal["dashboard", "library", "search", "calendar"] = "dashboard"
         self.current_trending_page = 1
         self.tmdb_genres: Dict[int, str] = {}
 
     def log_message(self, message: str):
-        self.tui_logger.info(message)
+        # Early-out so callers pay nothing when INFO is disabled
+        if self.tui_logger.isEnabledFor(logging.INFO):
+            self.tui_logger.info(message)
+
+    def log_debug(self, message):
+        """Debug log that accepts a callable, so hot paths can defer string
+        construction until we know DEBUG is actually enabled."""
+        if self.tui_logger.isEnabledFor(logging.DEBUG):
+            self.tui_logger.debug(message() if callable(message) else message)
 
     def get_mem_usage(self) -> str:
         """Reads /proc/self/status to get current RSS memory usage (Linux)."""
@@ -316,33 +417,31 @@ class RivenTUI(App):
         if error or logs is None:
             return
 
+        # (Re)bound the buffer if the configured limit changed
+        max_lines = self.settings.get("max_log_lines", 2000)
+        if self.global_logs.maxlen != max_lines:
+            self.global_logs = deque(self.global_logs, maxlen=max_lines)
+
         # Simple overlap detection
-        new_lines = []
         if not self.global_logs:
-            self.global_logs = logs
             new_lines = logs
         else:
             last_line = self.global_logs[-1]
             try:
-                idx = -1
-                for i in range(len(logs) - 1, -1, -1):
-                    if logs[i] == last_line:
-                        idx = i
-                        break
-                
+                # Index the fetched batch once (later duplicates win) instead
+                # of comparing strings backward in a Python-level loop
+                idx = {line: i for i, line in enumerate(logs)}.get(last_line, -1)
+
                 new_lines = logs[idx+1:] if idx != -1 else logs
-                if new_lines:
-                    self.global_logs.extend(new_lines)
             except Exception:
                 new_lines = logs
-                self.global_logs.extend(new_lines)
+
+        # Drop the TUI's own log-polling noise once at ingest; the filter
+        # and render paths then never re-check it per line
+        new_lines = [line for line in new_lines if "GET /api/v1/logs" not in line]
 
         if new_lines:
-            # Limit buffer to configured max lines
-            max_lines = self.settings.get("max_log_lines", 2000)
-            if len(self.global_logs) > max_lines:
-                self.global_logs = self.global_logs[-max_lines:]
-            
+            self.global_logs.extend(new_lines)
             # If user is in Logs view, trigger an update
             if self.app_state == "logs":
                 try:
@@ -358,7 +457,10 @@ class RivenTUI(App):
         if self.settings.get("tmdb_bearer_token"):
             redact_patterns.append(self.settings["tmdb_bearer_token"])
         
-        for handler in self.logger.handlers:
+        handlers = list(self.logger.handlers)
+        if self._log_listener:
+            handlers.extend(self._log_listener.handlers)
+        for handler in handlers:
             if hasattr(handler, "formatter") and isinstance(handler.formatter, RedactingFormatter):
                 handler.formatter.set_patterns(redact_patterns)
 
@@ -366,6 +468,7 @@ class RivenTUI(App):
     def on_settings_changed(self, message: SettingsView.SettingsChanged) -> None:
         # Merge new settings into memory to avoid losing TUI-specific keys like be_config
         self.settings.update(message.new_settings)
+        self._riven_key_cache = None
         self.reconfigure_redaction()
         self.log_message("Settings updated in memory (not saved to settings.json)")
 
@@ -404,12 +507,12 @@ class RivenTUI(App):
             error=colors["error"]
         )
 
-    def on_load(self) -> None: 
+    def on_load(self) -> None:
         try:
-            with open(SETTINGS_PATH, "r") as f:
-                self.settings = json.load(f)
+            # Settings were already read in __init__; avoid a second
+            # synchronous disk read during startup.
             self.reconfigure_redaction()
-            
+
             # Load and Register selected theme
             theme_name = self.settings.get("theme", "default")
             theme_path = os.path.join(THEMES_DIR, f"{theme_name}.tcss")
@@ -423,9 +526,19 @@ class RivenTUI(App):
             
         except Exception as e:
             pass
-        
-        self.chafa_available = shutil.which("chafa") is not None
-        
+
+    @property
+    def riven_key(self) -> Optional[str]:
+        """Riven API key, cached so hot button handlers avoid re-indexing settings."""
+        if self._riven_key_cache is None:
+            self._riven_key_cache = self.settings.get("riven_key")
+        return self._riven_key_cache
+
+    def _write_settings_file(self) -> None:
+        """Blocking settings.json write; wrap in asyncio.to_thread from async code."""
+        with open(SETTINGS_PATH, "w") as f:
+            json.dump(self.settings, f, indent=4)
+
     def build_url(self, config_key: str) -> str:
         cfg = self.settings.get(config_key, {})
         protocol = cfg.get("protocol", "http")
@@ -489,8 +602,7 @@ class RivenTUI(App):
             # 4. Save to settings - FIXED: Use absolute SETTINGS_PATH constant
             self.settings["theme"] = new_theme_name
             try:
-                with open(SETTINGS_PATH, "w") as f:
-                    json.dump(self.settings, f, indent=4)
+                self._write_settings_file()
             except Exception as e:
                 self.log_message(f"Theme: Error saving selection: {e}")
                 
@@ -519,7 +631,7 @@ class RivenTUI(App):
         
         self.tui_logger.debug(f"Selection changed: {len(self.library_selection)} items selected")
         try:
-            self.query_one(Sidebar).update_selection_count(len(self.library_selection))
+            self._get_sidebar().update_selection_count(len(self.library_selection))
         except:
             pass
 
@@ -555,32 +667,28 @@ class RivenTUI(App):
 
     async def check_for_updates(self):
         """Checks GitHub for a newer version string."""
-        import time
-        import re
         # Added cache-busting timestamp to URL
         url = f"https://raw.githubusercontent.com/subvhome/riven-tui/main/version.py?t={int(time.time())}"
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(url)
-                if resp.status_code == 200:
-                    remote_content = resp.text
-                    # Robust regex to catch VERSION = "1.2.3" or VERSION='1.2.3'
-                    match = re.search(r'VERSION\s*=\s*["\']([^"\']+)["\']', remote_content)
-                    if match:
-                        remote_version = match.group(1)
-                        
-                        def version_tuple(v):
-                            return tuple(map(int, (v.replace(",", ".").split("."))))
-                        
-                        try:
-                            if version_tuple(remote_version) > version_tuple(VERSION):
-                                # FIXED: Use the absolute BASE_DIR to detect if this is a git repo
-                                is_git = os.path.isdir(os.path.join(BASE_DIR, ".git"))
-                                
-                                self.push_screen(UpdateScreen(remote_version, is_git_repo=is_git))
-                                self.log_message(f"Update found: Local {VERSION} vs Remote {remote_version}")
-                        except Exception as e:
-                            self.log_message(f"Version comparison failed: {e}")
+            resp = await self._update_check_client.get(url)
+            if resp.status_code == 200:
+                remote_content = resp.text
+                match = _VERSION_RE.search(remote_content)
+                if match:
+                    remote_version = match.group(1)
+
+                    def version_tuple(v):
+                        return tuple(map(int, (v.replace(",", ".").split("."))))
+
+                    try:
+                        if version_tuple(remote_version) > version_tuple(VERSION):
+                            # FIXED: Use the absolute BASE_DIR to detect if this is a git repo
+                            is_git = os.path.isdir(os.path.join(BASE_DIR, ".git"))
+
+                            self.push_screen(UpdateScreen(remote_version, is_git_repo=is_git))
+                            self.log_message(f"Update found: Local {VERSION} vs Remote {remote_version}")
+                    except Exception as e:
+                        self.log_message(f"Version comparison failed: {e}")
         except Exception as e:
             self.log_message(f"Update check failed: {e}")
             
@@ -619,8 +727,14 @@ class RivenTUI(App):
                 patterns=redact_patterns
             )
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-            
+
+            # Route file writes through a background thread so the rotating
+            # handler's lock + disk I/O never block the asyncio event loop.
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(QueueHandler(log_queue))
+            self._log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            self._log_listener.start()
+
             # Textual Handler
             self.textual_handler = TextualLogHandler(self)
             self.textual_handler.setFormatter(formatter)
@@ -640,12 +754,18 @@ class RivenTUI(App):
         
         if "api_key" in self.settings and "riven_key" not in self.settings:
             self.settings["riven_key"] = self.settings.pop("api_key")
+            self._riven_key_cache = None
             try:
-                with open(SETTINGS_PATH, "w") as f:
-                    json.dump(self.settings, f, indent=4)
+                # Blocking file write runs in a thread so the startup worker
+                # doesn't stall the event loop before first paint
+                await asyncio.to_thread(self._write_settings_file)
             except Exception as e:
                 self.tui_logger.error(f"Migration Error: {e}")
 
+        # shutil.which stats every PATH entry; run it in a thread so the
+        # startup worker doesn't block the event loop.
+        self.chafa_available = await asyncio.to_thread(shutil.which, "chafa") is not None
+
         if not self.chafa_available:
             if not await self.push_screen_wait(ChafaCheckScreen()):
                 self.exit()
@@ -687,13 +807,29 @@ class RivenTUI(App):
         if not err: 
             self.tmdb_genres = genre_map
             self.log_message("Background: TMDB Genres loaded.")
-        
+
+        # Warm the library page cache for the default filters so the first
+        # Library click paints instantly instead of waiting on the API
+        self.run_worker(self._warm_library_cache())
+
         # Check for TUI updates
         await self.check_for_updates()
 
     async def on_unmount(self) -> None:
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
         if hasattr(self, "api"):
             await self.api.shutdown()
+        await self._update_check_client.aclose()
+
+    def schedule_dashboard_refresh(self, delay: float = 0.15) -> None:
+        """Coalesces rapid refresh triggers into a single worker run."""
+        if self._dashboard_refresh_timer:
+            self._dashboard_refresh_timer.stop()
+        self._dashboard_refresh_timer = self.set_timer(
+            delay, lambda: self.run_worker(self.refresh_dashboard(), group="state-refresh")
+        )
 
     async def refresh_dashboard(self):
         # Safety guard: Don't refresh if the API isn't initialized yet
@@ -713,107 +849,153 @@ class RivenTUI(App):
 
             self.log_message("Dashboard: Starting refresh...")
 
-            # Fetch stats, health, recently added, and trending in parallel
-            stats_task = self.api.get_stats(riven_key)
-            health_task = self.api.get_health(riven_key)
-            recent_task = self.api.get_items(
-                riven_key, 
-                limit=10, 
-                item_type=["movie", "show"], 
-                sort="date_desc", 
-                extended=False
+            # Each section fetches its own data and paints itself as soon as
+            # it resolves; the gather only joins them, so a slow trending call
+            # no longer delays stats or the recently-added list.
+            results = await asyncio.gather(
+                self._refresh_stats_section(dashboard_view, riven_key),
+                self._refresh_recent_section(dashboard_view, riven_key),
+                self._refresh_trending_section(dashboard_view),
+                self._refresh_services_section(dashboard_view, riven_key),
+                return_exceptions=True,
             )
-            trending_task = self.api.get_tmdb_trending(self.settings.get("tmdb_bearer_token"))
-            services_task = self.api.get_services(riven_key)
-            settings_task = self.api.get_settings(riven_key)
-            
-            self.log_message("Dashboard: Awaiting parallel API tasks...")
-            try:
-                results = await asyncio.gather(stats_task, health_task, recent_task, trending_task, services_task, settings_task, return_exceptions=True)
-                self.tui_logger.debug(f"Dashboard: Raw API results: {results}")
-                self.log_message(f"Dashboard: API tasks completed. Results count: {len(results)}")
-            except Exception as e:
-                self.tui_logger.error(f"Dashboard: Error in asyncio.gather: {e}", exc_info=True)
-                return
-            
-            stats_resp = results[0] if not isinstance(results[0], Exception) else (None, str(results[0]))
-            health_resp = results[1] if not isinstance(results[1], Exception) else (None, str(results[1]))
-            recent_resp = results[2] if not isinstance(results[2], Exception) else (None, str(results[2]))
-            trending_resp = results[3] if not isinstance(results[3], Exception) else (None, str(results[3]))
-            services_resp = results[4] if not isinstance(results[4], Exception) else (None, str(results[4]))
-            settings_resp = results[5] if not isinstance(results[5], Exception) else (None, str(results[5]))
-            
-            if any(isinstance(r, Exception) for r in results):
-                for i, r in enumerate(results):
-                    if isinstance(r, Exception):
-                        self.tui_logger.error(f"Dashboard: Task {i} failed: {r}")
+            for r in results:
+                if isinstance(r, Exception):
+                    self.tui_logger.error(f"Dashboard: Section refresh failed: {r}")
 
-            stats_data = stats_resp[0] if stats_resp and stats_resp[0] else {}
-            
-            # Parse health response
-            health_ok = False
-            if health_resp and health_resp[0]:
-                health_ok = health_resp[0].get("message") == "True"
-                self.tui_logger.debug(f"Dashboard: Health status: {health_ok}")
-            
-            self.log_message("Dashboard: Updating UI components...")
-            await dashboard_view.update_stats(stats_data, health_ok)
-            
-            # Update recently added
-            if recent_resp and recent_resp[0]:
-                recent_items = recent_resp[0].get("items",[])
-                self.tui_logger.debug(f"Dashboard: Found {len(recent_items)} recent items")
-                await dashboard_view.update_recently_added(recent_items)
-                self.run_worker(self._fetch_recent_ratings(recent_items))
-                
-            # Update trending
-            if trending_resp and trending_resp[0]:
-                trending_items = trending_resp[0]
-                self.tui_logger.debug(f"Dashboard: Found {len(trending_items)} trending items")
-                # Show the list immediately (as unknown status)
-                await dashboard_view.update_trending(trending_items)
-                # Trigger background check for library status
-                self.run_worker(self._check_trending_library_status(trending_items))
-
-            # Update service pills
-            if services_resp and services_resp[0] and settings_resp and settings_resp[0]:
-                self.tui_logger.debug("Dashboard: Updating service pills")
-                await dashboard_view.update_service_pills(services_resp[0], settings_resp[0])
-
-            # Update distribution grid
-            if stats_data.get("states"):
-                self.tui_logger.debug(f"Dashboard: Updating states overview: {stats_data['states']}")
-                await dashboard_view.update_states_overview(stats_data["states"])
-            
             self.log_message("Dashboard: Refresh complete.")
         finally:
             self._refreshing_dashboard = False
             self.stop_spinner()
 
+    async def _refresh_stats_section(self, dashboard_view, riven_key):
+        (stats_resp, _), (health_resp, _) = await asyncio.gather(
+            self.api.get_stats(riven_key),
+            self.api.get_health(riven_key),
+        )
+        stats_data = stats_resp or {}
+        health_ok = bool(health_resp) and health_resp.get("message") == "True"
+        self.tui_logger.debug(f"Dashboard: Health status: {health_ok}")
+        await dashboard_view.update_stats(stats_data, health_ok)
+        if stats_data.get("states"):
+            await dashboard_view.update_states_overview(stats_data["states"])
+
+    async def _refresh_recent_section(self, dashboard_view, riven_key):
+        resp, err = await self.api.get_items(
+            riven_key,
+            limit=10,
+            item_type=["movie", "show"],
+            sort="date_desc",
+            extended=False
+        )
+        if err or not resp:
+            return
+        recent_items = resp.get("items", [])
+        self.tui_logger.debug(f"Dashboard: Found {len(recent_items)} recent items")
+        await dashboard_view.update_recently_added(recent_items)
+        # Joined to the state-refresh group so leaving the dashboard cancels
+        # the ratings fetches along with the section workers
+        if self.app_state == "dashboard":
+            self.run_worker(self._fetch_recent_ratings(recent_items), group="state-refresh")
+
+    async def _refresh_trending_section(self, dashboard_view):
+        trending_items, err = await self.api.get_tmdb_trending(self.settings.get("tmdb_bearer_token"))
+        if err or not trending_items:
+            return
+        self.tui_logger.debug(f"Dashboard: Found {len(trending_items)} trending items")
+        # Show the list immediately (as unknown status)
+        await dashboard_view.update_trending(trending_items)
+        # Trigger background check for library status; skipped entirely if
+        # the user already navigated away, cancelled with the group if not
+        if self.app_state == "dashboard":
+            self.run_worker(self._check_trending_library_status(trending_items), group="state-refresh")
+
+    async def _refresh_services_section(self, dashboard_view, riven_key):
+        (services_resp, _), (settings_resp, _) = await asyncio.gather(
+            self.api.get_services(riven_key),
+            self.api.get_settings(riven_key),
+        )
+        if services_resp and settings_resp:
+            self.tui_logger.debug("Dashboard: Updating service pills")
+            await dashboard_view.update_service_pills(services_resp, settings_resp)
+
+    def _set_display(self, widget, value: bool) -> None:
+        # Only touch the style system when visibility actually changes;
+        # each display assignment otherwise triggers a layout recalc.
+        if widget.display != value:
+            widget.display = value
+
+    def _get_main_content(self) -> MainContent:
+        """MainContent lives for the app's lifetime; resolve it once."""
+        if self._main_content is None:
+            self._main_content = self.query_one(MainContent)
+        return self._main_content
+
+    def _get_sidebar(self) -> Sidebar:
+        """Sidebar lives for the app's lifetime; resolve it once."""
+        if self._sidebar is None:
+            self._sidebar = self.query_one(Sidebar)
+        return self._sidebar
+
+    # Top-level widgets visible in each app state; everything else is
+    # hidden in one table-driven pass. Per-state side effects (refresh
+    # workers, sidebar mode, focus) stay in watch_app_state.
+    _STATE_VISIBILITY = {
+        "welcome": frozenset({"welcome_message"}),
+        "dashboard": frozenset({"dashboard_view", "dashboard_wrapper"}),
+        "advanced": frozenset({"advanced_view"}),
+        "search": frozenset({"main_area", "main_content"}),
+        "library": frozenset({"main_area", "sidebar", "main_content"}),
+        "calendar": frozenset({"main_area", "sidebar", "main_content"}),
+        "settings": frozenset({"main_area", "sidebar", "settings_view"}),
+        "logs": frozenset({"logs_view"}),
+    }
+
+    def _get_state_widgets(self) -> Optional[Dict[str, object]]:
+        """Resolve the top-level per-state widgets once and reuse the refs.
+
+        These widgets exist for the app's whole lifetime, so the CSS-selector
+        walks only need to happen on the first state transition.
+        """
+        if self._state_widgets is None:
+            try:
+                self._state_widgets = {
+                    "welcome_message": self.query_one("#welcome-message"),
+                    "main_area": self.query_one("#main-area"),
+                    "sidebar": self._get_sidebar(),
+                    "main_content": self._get_main_content(),
+                    "settings_view": self.query_one(SettingsView),
+                    "dashboard_view": self.query_one(DashboardView),
+                    "dashboard_wrapper": self.query_one("#dashboard-wrapper"),
+                    "advanced_view": self.query_one(AdvancedView),
+                    "logs_view": self.query_one("#logs-view"),
+                }
+            except NoMatches:
+                return None
+        return self._state_widgets
+
     def watch_app_state(self, new_state: Literal["welcome", "dashboard", "search", "library", "calendar", "settings", "advanced", "logs"]) -> None:
         self.tui_logger.debug(f"App state changing to: {new_state}")
-        try:
-            welcome_message = self.query_one("#welcome-message")
-            main_area = self.query_one("#main-area")
-            sidebar = self.query_one(Sidebar)
-            main_content = self.query_one(MainContent)
-            settings_view = self.query_one(SettingsView)
-            dashboard_view = self.query_one(DashboardView)
-            dashboard_wrapper = self.query_one("#dashboard-wrapper")
-            advanced_view = self.query_one(AdvancedView)
-            logs_view = self.query_one("#logs-view")
-        except NoMatches:
+        widgets = self._get_state_widgets()
+        if widgets is None:
             return
+        sidebar = widgets["sidebar"]
+        main_content = widgets["main_content"]
+        settings_view = widgets["settings_view"]
+        logs_view = widgets["logs_view"]
+
+        # Cancel in-flight refresh workers from the previous state so rapid
+        # tab switching doesn't leave orphaned fetches mutating hidden widgets
+        self.workers.cancel_group(self, "state-refresh")
+        # A cancelled worker never reaches its stop_spinner() call, so clear
+        # any spinner the previous state left running
+        self.stop_spinner()
 
-        welcome_message.display = False
-        main_area.display = False
-        sidebar.display = False
-        main_content.display = False
-        settings_view.display = False
-        dashboard_view.display = False
-        dashboard_wrapper.display = False
-        advanced_view.display = False
-        logs_view.display = False
+        # One pass over the table instead of a hide-everything block plus
+        # per-state show calls
+        visible = self._STATE_VISIBILITY.get(new_state, frozenset())
+        for name, widget in widgets.items():
+            self._set_display(widget, name in visible)
 
         # Reset MainContent visibility state
         main_content.reset_view()
@@ -823,16 +1005,18 @@ class RivenTUI(App):
         main_content.query_one("#search-grid-scroll").add_class("hidden")
         main_content.query_one("#main-content-scroll-area").remove_class("hidden")
 
-        # Update Tab Classes and Labels
-        for btn in self.query(MenuButton):
-            btn.remove_class("-active")
-            if btn.id == "btn-header-logs":
+        # Update Tab Classes and Labels. Only the outgoing and incoming
+        # buttons change, so skip re-rendering the rest of the header.
+        prev_btn = self._active_menu_button
+        if prev_btn is not None:
+            prev_btn.remove_class("-active")
+            if prev_btn.id == "btn-header-logs":
                 # Preserve indicator state
                 indicator = "[bold green]●[/]" if self.background_logs_enabled else "[dim]○[/]"
-                btn.update(f"Logs {indicator}")
+                prev_btn.update(f"Logs {indicator}")
             else:
-                btn.update(btn.base_label)
-        
+                prev_btn.update(prev_btn.base_label)
+
         try:
             target_id = f"#btn-header-{new_state}"
             target_btn = self.query_one(target_id, MenuButton)
@@ -846,22 +1030,13 @@ class RivenTUI(App):
                  target_btn.update(f"Logs {indicator}")
             else:
                 target_btn.update(target_btn.base_label)
+            self._active_menu_button = target_btn
         except NoMatches:
-            pass
+            self._active_menu_button = None
 
-        if new_state == "welcome":
-            welcome_message.display = True
-        elif new_state == "dashboard":
-            dashboard_view.display = True
-            dashboard_wrapper.display = True
-            self.run_worker(self.refresh_dashboard())
-        elif new_state == "advanced":
-            advanced_view.display = True
+        if new_state == "dashboard":
+            self.schedule_dashboard_refresh()
         elif new_state == "search":
-            main_area.display = True
-            sidebar.display = False # Hide sidebar for full width
-            main_content.display = True 
-            
             # Switch to Grid Mode
             main_content.query_one("#main-content-scroll-area").add_class("hidden")
             main_content.query_one("#centered-search-container").remove_class("hidden")
@@ -874,31 +1049,18 @@ class RivenTUI(App):
                 pass
 
         elif new_state == "library":
-            main_area.display = True
-            sidebar.display = True
-            sidebar.show_library_filters() 
-            main_content.display = True
-            self.run_worker(self.show_library_items())
+            sidebar.show_library_filters()
+            self.run_worker(self.show_library_items(), group="state-refresh")
         elif new_state == "calendar":
-            main_area.display = True
-            sidebar.display = True 
-            sidebar.show_calendar_summary() 
-            main_content.display = True
+            sidebar.show_calendar_summary()
             main_content.query_one("#main-content-container").remove_children()
-            self.run_worker(self.show_calendar(refresh_cache=True))
+            self.run_worker(self.show_calendar(refresh_cache=True), group="state-refresh")
         elif new_state == "settings":
-            settings_view.display = True
-            sidebar.display = True
             sidebar.show_blank()
-            main_area.display = True
             if not settings_view.settings_data:
-                self.run_worker(settings_view.load_data())
+                self.run_worker(settings_view.load_data(), group="state-refresh")
         elif new_state == "logs":
-            logs_view.display = True
-            # Full width, no sidebar
-            main_area.display = False
-            sidebar.display = False
-            self.run_worker(logs_view.update_logs(refresh_all=True))
+            self.run_worker(logs_view.update_logs(refresh_all=True), group="state-refresh")
 
     def watch_base_title(self, new_title: str) -> None: 
         if self.spinner is not None:
@@ -930,7 +1092,7 @@ class RivenTUI(App):
 
     async def on_resize(self, event) -> None: 
         try:
-            main_content = self.query_one(MainContent)
+            main_content = self._get_main_content()
         except NoMatches:
             return
         
@@ -954,8 +1116,14 @@ class RivenTUI(App):
         except NoMatches:
             pass
 
-    async def on_refresh_poster(self, message: RefreshPoster) -> None: 
-        main_content = self.query_one(MainContent)
+    async def on_refresh_poster(self, message: RefreshPoster) -> None:
+        if self._refresh_poster_inflight:
+            # A render is already running; remember that one more pass is
+            # wanted and let the running pass re-post on completion
+            self._refresh_poster_queued = True
+            return
+
+        main_content = self._get_main_content()
         try:
             poster_widget = main_content.query_one("#poster-display", Static)
         except NoMatches:
@@ -996,18 +1164,29 @@ class RivenTUI(App):
         # Height for 2:3 aspect ratio
         target_height = int(target_width * 0.75)
 
-        # Only refresh if the difference is significant
+        # Only refresh if the difference is significant (at least 5% of the
+        # target width, never less than 2 cells)
+        threshold = max(2, target_width // 20)
         if (
             main_content.last_chafa_width is None
-            or abs(target_width - main_content.last_chafa_width) > 2
+            or abs(target_width - main_content.last_chafa_width) > threshold
         ):
             tmdb_data = main_content.tmdb_details
             if tmdb_data and tmdb_data.get("poster_path"):
                 poster_url = f"https://image.tmdb.org/t/p/w1280{tmdb_data['poster_path']}"
-                poster_art, error = await self.api.get_poster_chafa(poster_url, width=target_width, height=target_height)
-                if not error:
-                    poster_widget.update(Text.from_ansi(poster_art, no_wrap=True))
-                    main_content.last_chafa_width = target_width
+                self._refresh_poster_inflight = True
+                try:
+                    poster_art, error = await self.api.get_poster_chafa(poster_url, width=target_width, height=target_height)
+                    if not error:
+                        poster_widget.update(Text.from_ansi(poster_art, no_wrap=True))
+                        main_content.last_chafa_width = target_width
+                finally:
+                    self._refresh_poster_inflight = False
+                    if self._refresh_poster_queued:
+                        # The layout moved again mid-render; run one trailing
+                        # pass against the final size
+                        self._refresh_poster_queued = False
+                        self.post_message(RefreshPoster())
 
     @on(Input.Submitted, "#grid-search-input")
     async def on_grid_search_submitted(self, event: Input.Submitted):
@@ -1021,7 +1200,7 @@ class RivenTUI(App):
         self.log_message(f"SearchSubmitted received: {message.query}")
         self.app_state = "search" 
         
-        main_content = self.query_one(MainContent)
+        main_content = self._get_main_content()
         grid_container = main_content.query_one("#search-grid-container")
         
         # Reset visibility - ensure we are in grid mode
@@ -1030,7 +1209,7 @@ class RivenTUI(App):
         main_content.query_one("#search-grid-scroll").remove_class("hidden")
         main_content.query_one("#btn-back-to-actions").add_class("hidden")
 
-        await grid_container.query("*").remove() 
+        await grid_container.remove_children()
 
         await self.start_spinner(f"Searching for '{message.query}'")
         results, error = await self.api.search_tmdb(message.query, self.settings.get("tmdb_bearer_token"))
@@ -1052,25 +1231,31 @@ class RivenTUI(App):
             async with semaphore:
                 tmdb_token = self.settings.get("tmdb_bearer_token")
                 riven_key = self.settings.get("riven_key")
-                
-                # 1. Fetch TMDB Details
-                details, _ = await self.api.get_tmdb_details(item['media_type'], item['id'], tmdb_token)
-                if details:
-                    item.update(details)
-                
-                # 2. Check Library State
+
                 riven_media_type = "movie" if item['media_type'] == "movie" else "tv"
-                
-                # For TV, try to get TVDB ID if missing
-                lookup_id = item['id']
-                if riven_media_type == "tv":
+
+                if riven_media_type == "movie":
+                    # For movies the Riven lookup id is the TMDB id, so both
+                    # requests are independent — run them in parallel
+                    (details, _), lib_item = await asyncio.gather(
+                        self.api.get_tmdb_details(item['media_type'], item['id'], tmdb_token),
+                        self.api.get_item_by_id("movie", str(item['id']), riven_key),
+                    )
+                    if details:
+                        item.update(details)
+                else:
+                    # TV needs the TVDB id from the TMDB response first
+                    details, _ = await self.api.get_tmdb_details(item['media_type'], item['id'], tmdb_token)
+                    if details:
+                        item.update(details)
+
                     lookup_id = item.get("external_ids", {}).get("tvdb_id") or item['id']
+                    lib_item = await self.api.get_item_by_id("tv", str(lookup_id), riven_key)
 
-                lib_item = await self.api.get_item_by_id(riven_media_type, str(lookup_id), riven_key)
                 if lib_item:
                     item["state"] = lib_item.get("state", "Unknown")
                     item["riven_id"] = lib_item.get("id")
-                
+
                 return item
 
         detailed_results = await asyncio.gather(*(fetch_item_details(r) for r in results))
@@ -1081,19 +1266,15 @@ class RivenTUI(App):
         if not detailed_results:
             await grid_container.mount(Label("No results found."))
         else:
-            first_tile = None
-            for item in detailed_results:
-                tile = SearchGridTile(item, self.api)
-                if not first_tile:
-                    first_tile = tile
-                await grid_container.mount(tile)
-            
-            if first_tile:
-                first_tile.focus()
+            # Mount all tiles in one batch: a per-tile await yields to the
+            # event loop and triggers a layout pass for each of the 20 tiles
+            tiles = [SearchGridTile(item, self.api) for item in detailed_results]
+            await grid_container.mount(*tiles)
+            tiles[0].focus()
 
     async def _render_poster(self, container: Container, tmdb_data: dict, width_hint: Optional[int] = None):
         if self.chafa_available and tmdb_data.get("poster_path"):
-            main_content = self.query_one(MainContent)
+            main_content = self._get_main_content()
             
             # If no width hint is provided (initial load), mount an empty placeholder
             # The 100ms timer in show_item_actions will trigger a precise refresh.
@@ -1190,7 +1371,7 @@ class RivenTUI(App):
 
     async def handle_modal_result(self, result: any) -> None:
         if isinstance(result, dict) and result.get("action") == "trigger_manual_scrape":
-            main_content = self.query_one(MainContent)
+            main_content = self._get_main_content()
             main_content.item_data = result.get("item_data")
             main_content.tmdb_details = result.get("tmdb_details")
             main_content.item_details = result.get("item_details")
@@ -1252,8 +1433,9 @@ class RivenTUI(App):
         success, response = await self.api.add_item(riven_media_type, id_type, target_id, riven_key)
         if success:
             self.notify(f"'{title}' added successfully!", severity="success")
+            self._library_page_cache.clear()
             # Refresh the dashboard to update the [+] button status
-            self.run_worker(self.refresh_dashboard())
+            self.schedule_dashboard_refresh()
         else:
             self.notify(f"Failed to add '{title}': {response}", severity="error")
 
@@ -1348,22 +1530,67 @@ class RivenTUI(App):
         await self._open_media_card(tmdb_id, media_type)
 
     async def show_library_items(self, limit: int = 20, page: int = 1, sort: str = "date_desc", item_type: str | None = None, search: str | None = None, states: List[str] | None = None, refresh_cache: bool = False) -> None:
-        main_content = self.query_one(MainContent)
+        self._library_render_seq += 1
+        seq = self._library_render_seq
+        main_content = self._get_main_content()
         container = main_content.query_one("#main-content-container")
         lib_list = main_content.query_one("#library-list")
-        
-        await container.query("*").remove() 
+
+        await container.remove_children()
         lib_list.clear()
-        
-        await self.start_spinner("Fetching library...")
-        
+
         riven_key = self.settings.get("riven_key")
-        
+
         # Determine the types to send to the API.
         api_item_type = item_type if item_type is not None else ["movie", "show"]
-            
-        # 0. Initial Count-Only Fetch for immediate UI feedback
-        count_resp, count_err = await self.api.get_items(
+
+        if refresh_cache:
+            self._library_page_cache.clear()
+
+        cache_key = (
+            limit, page, sort,
+            tuple(api_item_type) if isinstance(api_item_type, list) else api_item_type,
+            search,
+            tuple(states) if states else None,
+        )
+        cached = self._library_page_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < LIBRARY_PAGE_CACHE_TTL:
+            # A superseded render may have been cancelled mid-fetch with its
+            # spinner still running; this path never starts one, so stop it
+            self.stop_spinner()
+            _, items, total_pages, total_count = cached
+            self.last_library_filters = {
+                "limit": limit,
+                "page": page,
+                "sort": sort,
+                "item_type": api_item_type,
+                "search": search,
+                "states": states,
+            }
+            sidebar = self._get_sidebar()
+            sidebar.update_pagination(page, total_pages, total_count, len(self.library_selection))
+
+            if not items:
+                container.remove_class("hidden")
+                lib_list.add_class("hidden")
+                await container.mount(Static("No library items found matching your filters.", id="empty-library-msg"))
+                return
+
+            container.add_class("hidden")
+            lib_list.remove_class("hidden")
+            await lib_list.extend(
+                LibraryItemCard(item, initial_selected=str(item.get("id")) in self.library_selection)
+                for item in items
+            )
+            self._prefetch_adjacent_library_pages(total_pages)
+            return
+
+        await self.start_spinner("Fetching library...")
+
+        # 0. Fire the count-only fetch and the actual page fetch concurrently;
+        # the count resolves first in practice and gives immediate UI feedback
+        # while the heavier item payload is still in flight.
+        count_task = self.api.get_items(
             riven_key,
             limit=limit,
             page=page,
@@ -1373,6 +1600,21 @@ class RivenTUI(App):
             states=states,
             count_only=True
         )
+        items_task = self.api.get_items(
+            riven_key,
+            limit=limit,
+            page=page,
+            sort=sort,
+            search=search,
+            item_type=api_item_type,
+            states=states,
+            extended=False,
+        )
+        (count_resp, count_err), (resp, err) = await asyncio.gather(count_task, items_task)
+
+        # Dropped if the user re-navigated while the fetch was in flight
+        if seq != self._library_render_seq:
+            return
 
         if not count_err and count_resp:
             total_count = int(count_resp.get("total_items", count_resp.get("total", 0)))
@@ -1389,21 +1631,9 @@ class RivenTUI(App):
             }
             
             # Update UI immediately with the accurate count
-            sidebar = self.query_one(Sidebar)
+            sidebar = self._get_sidebar()
             sidebar.update_pagination(page, total_pages, total_count, len(self.library_selection))
 
-        # 1. Fetch actual items
-        resp, err = await self.api.get_items(
-            riven_key, 
-            limit=limit, 
-            page=page, 
-            sort=sort, 
-            search=search, 
-            item_type=api_item_type, 
-            states=states,
-            extended=False,
-        )
-        
         self.stop_spinner()
 
         if err:
@@ -1415,13 +1645,14 @@ class RivenTUI(App):
         total_pages = int(resp.get("total_pages", math.ceil(total_count / limit) if limit > 0 else 1))
 
         # Sync UI again in case count shifted during enrichment or if first call failed
-        sidebar = self.query_one(Sidebar)
+        sidebar = self._get_sidebar()
         sidebar.update_pagination(page, total_pages, total_count, len(self.library_selection))
 
         if not items:
+            self._library_page_cache[cache_key] = (time.monotonic(), [], total_pages, total_count)
             container.remove_class("hidden")
             lib_list.add_class("hidden")
-            await container.query("*").remove()
+            await container.remove_children()
             await container.mount(Static("No library items found matching your filters.", id="empty-library-msg"))
             return
 
@@ -1431,75 +1662,154 @@ class RivenTUI(App):
         lib_list.clear() # Clear again to be safe before enrichment
 
         await self.start_spinner("Enriching library data...")
-        # Parallel fetch TMDB details for all items to get ratings/genres/taglines
-        async def enrich_item(item):
-            try:
-                # 1. Identify IDs
-                # Riven internal list ID
-                item["riven_id"] = str(item.get("id"))
-                
-                m_type = item.get("type", "movie")
-                tmdb_m_type = "movie" if m_type == "movie" else "tv"
-                
-                # lookup_id is what Riven detail API expects (TMDB for movie, TVDB for show)
-                lookup_id = item.get("tmdb_id") if m_type == "movie" else (item.get("tvdb_id") or (item.get("parent_ids") or {}).get("tvdb_id"))
-                if not lookup_id and m_type == "show":
-                    lookup_id = item.get("id")
-                
-                item["lookup_id"] = str(lookup_id) if lookup_id else None
-                
-                # 2. Identify TMDB ID for metadata enrichment
-                tmdb_token = self.settings.get("tmdb_bearer_token")
-                tmdb_id = await self.api.resolve_tmdb_id(item, tmdb_token)
+        # Parallel fetch TMDB details for all items to get ratings/genres/taglines.
+        # Bounded so large page sizes don't flood TMDB with simultaneous requests.
+        semaphore = asyncio.Semaphore(10)
 
-                # 3. Enrich
-                if tmdb_id:
-                    details, _ = await self.api.get_tmdb_details(tmdb_m_type, tmdb_id, tmdb_token)
-                    if details:
-                        # Preserve Riven-specific fields that TMDB might overwrite or lack
-                        p_title = item.get("parent_title")
-                        # Preserve all variations of S/E keys and flags
-                        preserved_vals = {
-                            k: item.get(k) for k in [
-                                "season_number", "episode_number", 
-                                "seasonNumber", "episodeNumber",
-                                "season", "episode", "is_anime"
-                            ] if item.get(k) is not None
-                        }
-                        
-                        # Only take "enrichment" fields from TMDB
-                        enrichment_fields = [
-                            "tagline", "genres", "vote_average", "vote_count", 
-                            "overview", "popularity", "content_rating", "original_language"
-                        ]
-                        for field in enrichment_fields:
-                            if field in details:
-                                item[field] = details[field]
-                        
-                        # Restore preserved fields
-                        if p_title: item["parent_title"] = p_title
-                        for k, v in preserved_vals.items():
-                            item[k] = v
-                        
-                        # Use TMDB poster if Riven doesn't provide one
-                        if not item.get("poster_path") and details.get("poster_path"):
-                            item["poster_path"] = details["poster_path"]
-                        
-                        item["tmdb_id"] = tmdb_id
-            except Exception as e:
-                self.tui_logger.error(f"Failed to enrich library item: {e}")
-            
-            return item
+        async def enrich_item(item):
+            async with semaphore:
+                return await self._enrich_library_item(item)
 
         results = await asyncio.gather(*(enrich_item(i) for i in items), return_exceptions=True)
         # Filter out any actual Exception objects that might have bubbled up
         items = [r for r in results if isinstance(r, dict)]
         self.stop_spinner()
 
-        for item in items:
-            is_selected = str(item.get("id")) in self.library_selection
-            await lib_list.append(LibraryItemCard(item, initial_selected=is_selected))
+        self._library_page_cache[cache_key] = (time.monotonic(), items, total_pages, total_count)
+
+        if seq != self._library_render_seq:
+            return
+
+        # One extend() batches the whole page into a single layout pass;
+        # per-card append() awaited a refresh for every row
+        await lib_list.extend(
+            LibraryItemCard(item, initial_selected=str(item.get("id")) in self.library_selection)
+            for item in items
+        )
+
+        self._prefetch_adjacent_library_pages(total_pages)
+
+    async def _enrich_library_item(self, item):
+        try:
+            # 1. Identify IDs
+            # Riven internal list ID
+            item["riven_id"] = str(item.get("id"))
+
+            m_type = item.get("type", "movie")
+            tmdb_m_type = "movie" if m_type == "movie" else "tv"
+
+            # lookup_id is what Riven detail API expects (TMDB for movie, TVDB for show)
+            lookup_id = item.get("tmdb_id") if m_type == "movie" else (item.get("tvdb_id") or (item.get("parent_ids") or {}).get("tvdb_id"))
+            if not lookup_id and m_type == "show":
+                lookup_id = item.get("id")
+
+            item["lookup_id"] = str(lookup_id) if lookup_id else None
+
+            # 2. Identify TMDB ID for metadata enrichment
+            tmdb_token = self.settings.get("tmdb_bearer_token")
+            tmdb_id = await self.api.resolve_tmdb_id(item, tmdb_token)
+
+            # 3. Enrich
+            if tmdb_id:
+                details, _ = await self.api.get_tmdb_details(tmdb_m_type, tmdb_id, tmdb_token)
+                if details:
+                    # Preserve Riven-specific fields that TMDB might overwrite or lack
+                    p_title = item.get("parent_title")
+                    # Preserve all variations of S/E keys and flags
+                    preserved_vals = {
+                        k: item.get(k) for k in [
+                            "season_number", "episode_number",
+                            "seasonNumber", "episodeNumber",
+                            "season", "episode", "is_anime"
+                        ] if item.get(k) is not None
+                    }
+
+                    # Only take "enrichment" fields from TMDB
+                    enrichment_fields = [
+                        "tagline", "genres", "vote_average", "vote_count",
+                        "overview", "popularity", "content_rating", "original_language"
+                    ]
+                    for field in enrichment_fields:
+                        if field in details:
+                            item[field] = details[field]
+
+                    # Restore preserved fields
+                    if p_title: item["parent_title"] = p_title
+                    for k, v in preserved_vals.items():
+                        item[k] = v
+
+                    # Use TMDB poster if Riven doesn't provide one
+                    if not item.get("poster_path") and details.get("poster_path"):
+                        item["poster_path"] = details["poster_path"]
+
+                    item["tmdb_id"] = tmdb_id
+        except Exception as e:
+            self.tui_logger.error(f"Failed to enrich library item: {e}")
+
+        return item
+
+    async def _warm_library_cache(self) -> None:
+        """Prefetch the default first library page so the initial Library click renders from cache."""
+        await self._prefetch_library_page(limit=20, page=1, sort="date_desc")
+
+    async def _prefetch_library_page(self, limit: int = 20, page: int = 1, sort: str = "date_desc", item_type: str | None = None, search: str | None = None, states: List[str] | None = None) -> None:
+        """Fetch, enrich and cache one library page without touching the UI."""
+        riven_key = self.settings.get("riven_key")
+        if not riven_key:
+            return
+
+        api_item_type = item_type if item_type is not None else ["movie", "show"]
+        cache_key = (
+            limit, page, sort,
+            tuple(api_item_type) if isinstance(api_item_type, list) else api_item_type,
+            search,
+            tuple(states) if states else None,
+        )
+        cached = self._library_page_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < LIBRARY_PAGE_CACHE_TTL:
+            return
+
+        try:
+            resp, err = await self.api.get_items(
+                riven_key,
+                limit=limit,
+                page=page,
+                sort=sort,
+                search=search,
+                item_type=api_item_type,
+                states=states,
+                extended=False,
+            )
+            if err or not resp:
+                return
+
+            items = resp.get("items", [])
+            total_count = int(resp.get("total_items", resp.get("total", 0)))
+            total_pages = int(resp.get("total_pages", math.ceil(total_count / limit) if limit > 0 else 1))
+
+            semaphore = asyncio.Semaphore(10)
+
+            async def enrich_item(item):
+                async with semaphore:
+                    return await self._enrich_library_item(item)
+
+            results = await asyncio.gather(*(enrich_item(i) for i in items), return_exceptions=True)
+            items = [r for r in results if isinstance(r, dict)]
+
+            self._library_page_cache[cache_key] = (time.monotonic(), items, total_pages, total_count)
+            self.tui_logger.debug("Library page %s prefetched.", page)
+        except Exception as e:
+            self.tui_logger.debug("Library prefetch failed: %s", e)
 
+    def _prefetch_adjacent_library_pages(self, total_pages: int) -> None:
+        """Warms the cache for page N±1 so sequential paging serves instantly."""
+        if not self.last_library_filters:
+            return
+        page = self.last_library_filters.get("page", 1)
+        for target in (page + 1, page - 1):
+            if 1 <= target <= total_pages and target != page:
+                params = dict(self.last_library_filters, page=target)
+                self.run_worker(self._prefetch_library_page(**params), group="library-prefetch")
 
     @on(ListView.Selected, "#library-list")
     async def on_library_item_clicked(self, event: ListView.Selected) -> None: 
@@ -1547,55 +1857,134 @@ class RivenTUI(App):
         if error:
             self.notify(f"Error fetching logs: {error}", severity="error")
             return
-        self.previous_logs = logs
         limit = self.settings.get("log_display_limit", 20)
         log_lines = logs.splitlines()
-        display_logs = "\n".join(log_lines[-limit:])
-        main_content = self.query_one(MainContent)
-        await main_content.display_logs(display_logs)
+        self._previous_log_line_count = len(log_lines)
+        self._log_buffer = log_lines[-limit:]
+        main_content = self._get_main_content()
+        await main_content.display_logs("\n".join(self._log_buffer))
+
+    def _schedule_library_page(self, page: int, delay: float = 0.15) -> None:
+        """Coalesces rapid page clicks so only the final page hits the API."""
+        self._library_nav_page = page
+        if self._library_nav_timer:
+            self._library_nav_timer.stop()
+
+        def fire():
+            params = self.last_library_filters.copy()
+            params["page"] = self._library_nav_page
+            self._library_nav_page = None
+            self.run_worker(
+                self.show_library_items(**params),
+                name="show_library_items",
+                exclusive=True
+            )
+
+        self._library_nav_timer = self.set_timer(delay, fire)
+
+    def _schedule_calendar_render(self, delay: float = 0.15) -> None:
+        """Coalesces rapid month/year clicks into a single calendar rebuild."""
+        if self._calendar_nav_timer:
+            self._calendar_nav_timer.stop()
+        self._calendar_nav_timer = self.set_timer(
+            delay, lambda: self.run_worker(self.show_calendar(), name="show_calendar", exclusive=True)
+        )
 
     @on(Button.Pressed, "#btn-prev-page")
     async def on_prev_page_click(self, event: Button.Pressed):
         event.stop()
         if self.last_library_filters:
-            current_page = self.last_library_filters.get("page", 1)
+            current_page = self._library_nav_page or self.last_library_filters.get("page", 1)
             if current_page > 1:
-                params = self.last_library_filters.copy()
-                params["page"] = current_page - 1
-                self.run_worker(
-                    self.show_library_items(**params),
-                    name="show_library_items",
-                    exclusive=True
-                )
+                self._schedule_library_page(current_page - 1)
 
     @on(Button.Pressed, "#btn-next-page")
     async def on_next_page_click(self, event: Button.Pressed):
         event.stop()
         if self.last_library_filters:
-            current_page = self.last_library_filters.get("page", 1)
-            params = self.last_library_filters.copy()
-            params["page"] = current_page + 1
-            self.run_worker(
-                self.show_library_items(**params),
-                name="show_library_items",
-                exclusive=True
-            )
+            current_page = self._library_nav_page or self.last_library_filters.get("page", 1)
+            self._schedule_library_page(current_page + 1)
 
     @on(MonthChanged)
     async def on_month_changed(self, event: MonthChanged):
         self.current_calendar_date = datetime(event.year, event.month, 1)
-        await self.show_calendar()
+        self._schedule_calendar_render()
 
     @on(FilterPill.Changed)
     async def on_calendar_filter_changed(self, event: FilterPill.Changed):
         self.calendar_filters[event.filter_type] = event.value
-        await self.show_calendar()
+        # Cards for types that were disabled at mount time were never
+        # created, so a pill turning back on needs the full rebuild; turning
+        # one off only hides cards that are guaranteed to be mounted.
+        if event.value or not await self._apply_calendar_filters():
+            await self.show_calendar()
+
+    async def _apply_calendar_filters(self) -> bool:
+        """Toggle visibility of the mounted calendar cards in place.
+
+        A filter-pill change only affects which item types are shown, so the
+        already-mounted month can be filtered with display flips instead of a
+        full teardown and rebuild. Returns False when nothing is mounted
+        (e.g. the month rendered empty), so the caller falls back to a rebuild.
+        """
+        main_content = self._get_main_content()
+        container = main_content.query_one("#main-content-container")
+        day_groups = container.query(".calendar-day-group")
+        if not day_groups:
+            return False
+
+        active_days = set()
+        for group in day_groups:
+            visible = 0
+            for card in group.query(CalendarItemCard):
+                i_type = card.item_data.get("item_type")
+                show = self.calendar_filters.get(i_type, True) if i_type else True
+                self._set_display(card, show)
+                if show:
+                    visible += 1
+            self._set_display(group, visible > 0)
+            if visible:
+                try:
+                    count_label = group.query_one(".calendar-count-label", Label)
+                    count_label.update(f"{visible} item{'s' if visible > 1 else ''}")
+                    active_days.add(int(group.id.rsplit("-", 1)[-1]))
+                except (NoMatches, ValueError):
+                    pass
+
+        sidebar = self._get_sidebar()
+        await sidebar.update_calendar_grid(
+            self.current_calendar_date.year, self.current_calendar_date.month, active_days
+        )
+        return True
+
+    async def _ensure_calendar_chrome(self, container, year: int, month: int) -> None:
+        """Mount the month header and filter legend once per container.
+
+        Month navigation then just updates the label and pill values instead
+        of re-mounting the same header and four pills on every render.
+        """
+        try:
+            header = container.query_one(CalendarHeader)
+        except NoMatches:
+            filters = [("movie", "Movies"), ("episode", "Episodes"), ("show", "Shows"), ("season", "Seasons")]
+            legend_row = Horizontal(
+                *[FilterPill(label, value=self.calendar_filters[f_type], filter_type=f_type) for f_type, label in filters],
+                id="calendar-legend-row"
+            )
+            await container.mount(CalendarHeader(year, month), legend_row)
+            return
+        header.set_month(year, month)
+        for pill in container.query(FilterPill):
+            pill.value = self.calendar_filters[pill.filter_type]
+            pill.set_class(pill.value, "-on")
 
     async def show_calendar(self, refresh_cache: bool = False) -> None:
-        main_content = self.query_one(MainContent)
+        self._calendar_render_seq += 1
+        seq = self._calendar_render_seq
+        main_content = self._get_main_content()
         container = main_content.query_one("#main-content-container")
         if not self.calendar_cache or refresh_cache:
-            await container.query("*").remove()
+            await container.remove_children()
             await self.start_spinner("Fetching calendar...")
             riven_key = self.settings.get("riven_key")
             resp, err = await self.api.get_calendar(riven_key)
@@ -1607,114 +1996,104 @@ class RivenTUI(App):
             self.tui_logger.debug(f"Calendar raw response: {resp}")
             
             if isinstance(resp, dict) and "data" in resp:
-                self.calendar_cache = list(resp["data"].values())
+                # Parse aired_at once at cache-fill; month/filter re-renders
+                # then compare the stored datetime instead of re-parsing every
+                # string. Items without a parseable date are never rendered,
+                # so they're dropped here.
+                self.calendar_cache = self._parse_calendar_items(resp["data"].values())
             else:
                 self.calendar_cache = []
+            # Sort once at cache-fill; bucketing preserves order, so each
+            # month render iterates pre-sorted items instead of re-sorting
+            self.calendar_cache.sort(key=itemgetter("_dt"))
+            self.calendar_month_index = {}
+            for item in self.calendar_cache:
+                dt = item["_dt"]
+                self.calendar_month_index.setdefault((dt.year, dt.month), []).append(item)
             self.stop_spinner()
+            # A newer navigation superseded this render while the fetch was in
+            # flight; the cache is filled, so let the newer run paint instead
+            if seq != self._calendar_render_seq:
+                return
         year = self.current_calendar_date.year
         month = self.current_calendar_date.month
         monthly_items = []
-        for item in self.calendar_cache:
+        for item in self.calendar_month_index.get((year, month), []):
             i_type = item.get("item_type")
             if i_type and not self.calendar_filters.get(i_type, True):
                 continue
-            aired_at_str = item.get("aired_at")
-            if aired_at_str:
-                try:
-                    if "T" in aired_at_str:
-                        dt = datetime.fromisoformat(aired_at_str)
-                    else:
-                        dt = datetime.strptime(aired_at_str, "%Y-%m-%d %H:%M:%S")
-                    if dt.year == year and dt.month == month:
-                        item["_dt"] = dt
-                        monthly_items.append(item)
-                except ValueError:
-                    continue
-        monthly_items.sort(key=lambda x: x["_dt"])
+            monthly_items.append(item)
+        # Items arrive sorted, so one strftime per day instead of per item
         grouped_items: Dict[str, List[dict]] = {}
         active_days = set()
-        for item in monthly_items:
-            date_key = item["_dt"].strftime("%a, %B %d")
-            if date_key not in grouped_items:
-                grouped_items[date_key] = []
-            grouped_items[date_key].append(item)
-            active_days.add(item["_dt"].day)
+        for day, group in groupby(monthly_items, key=lambda i: i["_dt"].date()):
+            group = list(group)
+            grouped_items[group[0]["_dt"].strftime("%a, %B %d")] = group
+            active_days.add(day.day)
             
-        sidebar = self.query_one(Sidebar)
+        sidebar = self._get_sidebar()
         await sidebar.update_calendar_grid(year, month, active_days)
 
-        await container.query("*").remove()
-        await container.mount(CalendarHeader(year, month))
-        legend_row = Horizontal(id="calendar-legend-row")
-        await container.mount(legend_row)
-        filters = [("movie", "Movies"), ("episode", "Episodes"), ("show", "Shows"), ("season", "Seasons")]
-        for f_type, label in filters:
-            pill = FilterPill(label, value=self.calendar_filters[f_type], filter_type=f_type)
-            await legend_row.mount(pill)
-        sidebar = self.query_one(Sidebar)
-        await sidebar.update_calendar_grid(year, month, active_days)
+        # The header and legend survive navigation; tear down only the day
+        # groups (and any empty-month notice) before mounting the new month.
+        await self._ensure_calendar_chrome(container, year, month)
+        await container.remove_children(".calendar-day-group")
+        await container.remove_children("#calendar-no-items")
+
+        # Build the whole month subtree in memory first, then mount it in one
+        # batch; per-widget awaited mounts each paid their own layout pass.
+        def build_day_group(date_str: str, items: List[dict]) -> Vertical:
+            header_row = Horizontal(
+                Label(date_str, classes="calendar-date-label"),
+                Label(f"{len(items)} item{'s' if len(items) > 1 else ''}", classes="calendar-count-label"),
+                classes="calendar-day-header",
+            )
+            return Vertical(
+                header_row,
+                *[CalendarItemCard(item) for item in items],
+                classes="calendar-day-group",
+                id=f"day-group-{items[0]['_dt'].day}",
+            )
+
+        def jump_to_day(target_day_num: int):
+            try:
+                target_widget = container.query_one(f"#day-group-{target_day_num}")
+                target_widget.scroll_visible(top=True, animate=False)
+            except NoMatches:
+                pass
 
-        await container.query("*").remove()
-        await container.mount(CalendarHeader(year, month))
-        legend_row = Horizontal(id="calendar-legend-row")
-        await container.mount(legend_row)
-        filters = [("movie", "Movies"), ("episode", "Episodes"), ("show", "Shows"), ("season", "Seasons")]
-        for f_type, label in filters:
-            pill = FilterPill(label, value=self.calendar_filters[f_type], filter_type=f_type)
-            await legend_row.mount(pill)
-            
         # Logic to find the best day to scroll to or prompt for next event
         today = datetime.now()
         has_future_items_this_month = any(item["_dt"].date() >= today.date() for item in monthly_items)
-        
+
         if not monthly_items or (not has_future_items_this_month and year == today.year and month == today.month):
             if not monthly_items:
-                await container.mount(Static(f"No items found for {calendar.month_name[month]} {year}.", id="calendar-no-items"))
+                await container.mount(
+                    Static(f"No items found for {_MONTH_NAMES[month]} {year}.", id="calendar-no-items"),
+                )
             else:
                 # Render the past items normally
                 target_day_num = None
+                day_groups = []
                 for date_str, items in grouped_items.items():
-                    day_num = items[0]["_dt"].day
-                    day_group = Vertical(classes="calendar-day-group", id=f"day-group-{day_num}")
-                    await container.mount(day_group)
-                    header_row = Horizontal(classes="calendar-day-header")
-                    await day_group.mount(header_row)
-                    await header_row.mount(Label(date_str, classes="calendar-date-label")),
-                    await header_row.mount(Label(f"{len(items)} item{'s' if len(items) > 1 else ''}", classes="calendar-count-label")),
-                    for item in items:
-                        await day_group.mount(CalendarItemCard(item))
-                    
+                    day_groups.append(build_day_group(date_str, items))
                     if target_day_num is None: # Just scroll to first one if all are past
-                        target_day_num = day_num
+                        target_day_num = items[0]["_dt"].day
+                await container.mount(*day_groups)
 
                 if target_day_num is not None:
-                    def jump_to_day():
-                        try:
-                            target_widget = container.query_one(f"#day-group-{target_day_num}")
-                            target_widget.scroll_visible(top=True, animate=False)
-                        except NoMatches:
-                            pass
-                    self.set_timer(0.1, jump_to_day)
+                    self.set_timer(0.1, lambda: jump_to_day(target_day_num))
 
             # Check for next available event in FUTURE months
             next_event_date = None
             viewed_month_end = datetime(year, month, calendar.monthrange(year, month)[1], 23, 59, 59)
-            
+
             for item in self.calendar_cache:
-                aired_at_str = item.get("aired_at")
-                if not aired_at_str: continue
-                try:
-                    if "T" in aired_at_str:
-                        dt = datetime.fromisoformat(aired_at_str)
-                    else:
-                        dt = datetime.strptime(aired_at_str, "%Y-%m-%d %H:%M:%S")
-                    
-                    if dt > viewed_month_end:
-                        if next_event_date is None or dt < next_event_date:
-                            next_event_date = dt
-                except ValueError:
-                    continue
-            
+                dt = item["_dt"]
+                if dt > viewed_month_end:
+                    if next_event_date is None or dt < next_event_date:
+                        next_event_date = dt
+
             if next_event_date:
                 def ask_jump():
                     self.run_worker(self._prompt_jump_to_date(next_event_date))
@@ -1722,49 +2101,54 @@ class RivenTUI(App):
 
         else:
             target_day_num = None
-            
+            day_groups = []
             for date_str, items in grouped_items.items():
-                day_num = items[0]["_dt"].day
-                day_group = Vertical(classes="calendar-day-group", id=f"day-group-{day_num}")
-                await container.mount(day_group)
-                header_row = Horizontal(classes="calendar-day-header")
-                await day_group.mount(header_row)
-                await header_row.mount(Label(date_str, classes="calendar-date-label")),
-                await header_row.mount(Label(f"{len(items)} item{'s' if len(items) > 1 else ''}", classes="calendar-count-label")),
-                for item in items:
-                    await day_group.mount(CalendarItemCard(item))
-                
+                day_groups.append(build_day_group(date_str, items))
+
                 # Logic to find the best day to scroll to
                 # We want the first day that is >= today
                 if target_day_num is None:
                     item_dt = items[0]["_dt"]
                     if item_dt.year == today.year and item_dt.month == today.month:
                         if item_dt.day >= today.day:
-                            target_day_num = day_num
+                            target_day_num = item_dt.day
                     elif item_dt.year > today.year or (item_dt.year == today.year and item_dt.month > today.month):
                         # Future month/year, pick the first available day
-                        target_day_num = day_num
+                        target_day_num = item_dt.day
+
+            await container.mount(*day_groups)
 
             # Perform the jump
             if target_day_num is not None:
-                def jump_to_day():
-                    try:
-                        target_widget = container.query_one(f"#day-group-{target_day_num}")
-                        target_widget.scroll_visible(top=True, animate=False)
-                    except NoMatches:
-                        pass
-                self.set_timer(0.1, jump_to_day)
+                self.set_timer(0.1, lambda: jump_to_day(target_day_num))
+
+    def _parse_calendar_items(self, raw_items) -> List[dict]:
+        """Attach a parsed _dt datetime to each item, skipping unparseable ones."""
+        parsed = []
+        for item in raw_items:
+            aired_at_str = item.get("aired_at")
+            if not aired_at_str:
+                continue
+            try:
+                if "T" in aired_at_str:
+                    item["_dt"] = datetime.fromisoformat(aired_at_str)
+                else:
+                    item["_dt"] = datetime.strptime(aired_at_str, "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                continue
+            parsed.append(item)
+        return parsed
 
     def _change_month(self, dt: datetime, months: int) -> datetime:
         """Safely change month, clamping day to valid range."""
-        month = dt.month - 1 + months
-        year = dt.year + month // 12
-        month = month % 12 + 1
+        year_delta, month = divmod(dt.month - 1 + months, 12)
+        year = dt.year + year_delta
+        month += 1
         day = min(dt.day, calendar.monthrange(year, month)[1])
         return dt.replace(year=year, month=month, day=day)
 
     async def _prompt_jump_to_date(self, target_date: datetime) -> None:
-        month_name = calendar.month_name[target_date.month]
+        month_name = _MONTH_NAMES[target_date.month]
         date_str = target_date.strftime("%B %d, %Y")
         
         confirmed = await self.push_screen_wait(ConfirmationScreen(
@@ -1782,25 +2166,25 @@ class RivenTUI(App):
     @on(Button.Pressed, "#btn-prev-year-main")
     async def on_prev_year(self):
         self.current_calendar_date = self._change_month(self.current_calendar_date, -12)
-        await self.show_calendar()
+        self._schedule_calendar_render()
 
     @on(Button.Pressed, "#btn-next-year-sidebar")
     @on(Button.Pressed, "#btn-next-year-main")
     async def on_next_year(self):
         self.current_calendar_date = self._change_month(self.current_calendar_date, 12)
-        await self.show_calendar()
+        self._schedule_calendar_render()
 
     @on(Button.Pressed, "#btn-prev-month-sidebar")
     @on(Button.Pressed, "#btn-prev-month-main")
     async def on_prev_month(self):
         self.current_calendar_date = self._change_month(self.current_calendar_date, -1)
-        await self.show_calendar()
+        self._schedule_calendar_render()
 
     @on(Button.Pressed, "#btn-next-month-sidebar")
     @on(Button.Pressed, "#btn-next-month-main")
     async def on_next_month(self):
         self.current_calendar_date = self._change_month(self.current_calendar_date, 1)
-        await self.show_calendar()
+        self._schedule_calendar_render()
 
     @on(Button.Pressed, "#btn-refresh-logs")
     async def refresh_logs(self):
@@ -1812,22 +2196,22 @@ class RivenTUI(App):
         if error:
             self.notify(f"Error fetching logs: {error}", severity="error")
             return
-        if logs != self.previous_logs:
-            previous_lines = self.previous_logs.splitlines()
-            new_lines = logs.splitlines()
-            diff = new_lines[len(previous_lines):]
-            if diff:
-                log_content = self.query_one("#log-content", Static)
-                current_content = log_content.render()
-                new_content = str(current_content) + "\n" + "\n".join(diff)
-                log_content.update(new_content)
-            self.previous_logs = logs
+        new_lines = logs.splitlines()
+        diff = new_lines[self._previous_log_line_count:]
+        if diff:
+            # Append the tail to the tracked buffer rather than re-reading the
+            # widget's rendered content and concatenating the whole body
+            self._log_buffer.extend(diff)
+            if len(self._log_buffer) > 10000:
+                del self._log_buffer[:-10000]
+            self.query_one("#log-content", Static).update("\n".join(self._log_buffer))
+            self._previous_log_line_count = len(new_lines)
         else:
             self.notify("No new logs.")
 
     @on(Button.Pressed, "#btn-print-json")
     async def handle_print_json(self):
-        main_content = self.query_one(MainContent)
+        main_content = self._get_main_content()
         tmdb_details = main_content.tmdb_details
         item_data = main_content.item_data
         
@@ -1843,7 +2227,7 @@ class RivenTUI(App):
                 external_id = str(tvdb_id) if media_type == "tv" and tvdb_id else str(tmdb_id)
             
             await self.start_spinner("Fetching extended Riven data...")
-            extended_data = await self.api.get_item_by_id(media_type, str(external_id), self.settings.get("riven_key"), extended=True)
+            extended_data = await self.api.get_item_by_id(media_type, str(external_id), self.riven_key, extended=True)
             self.stop_spinner()
             
             data = extended_data or main_content.item_details or {"info": "Item not in Riven library"}
@@ -1852,12 +2236,50 @@ class RivenTUI(App):
             
         await main_content.display_json(data)
 
+    async def _refresh_current_item_data_and_ui(self, delay: float = 0.0) -> None:
+        """Schedule a trailing-debounced refresh of the open item card.
+
+        Back-to-back actions (e.g. retry then delete) each request a delayed
+        refresh; only the last one runs, and the longest outstanding delay
+        wins so the backend has time to settle before we re-fetch.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_deadline = max(self._refresh_deadline, deadline)
+            self._refresh_task.cancel()
+        else:
+            self._refresh_deadline = deadline
+
+        async def run() -> None:
+            remaining = self._refresh_deadline - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            await self._do_refresh_current_item()
+
+        self._refresh_task = asyncio.create_task(run())
+
+    async def _do_refresh_current_item(self) -> None:
+        """Re-fetch Riven details for the item currently shown in MainContent."""
+        try:
+            main_content = self._get_main_content()
+        except NoMatches:
+            return
+        item_data = main_content.item_data
+        if not item_data:
+            return
+        media_type = "tv" if item_data.get("media_type") in ["tv", "show"] else "movie"
+        lookup_id = item_data.get("riven_id") or item_data.get("id")
+        if not lookup_id:
+            return
+        main_content.item_details = await self.api.get_item_by_id(media_type, str(lookup_id), self.riven_key)
+
     @on(Button.Pressed, "#btn-delete")
     def on_delete_click(self) -> None:
         self.run_worker(self.handle_delete())
 
     async def handle_delete(self):
-        main_content = self.query_one(MainContent)
+        main_content = self._get_main_content()
         item_id = main_content.item_details.get("id")
         if not item_id: return
         title = main_content.item_details.get("title") or "Unknown Item"
@@ -1871,9 +2293,10 @@ class RivenTUI(App):
         
         if not confirmed: return
 
-        success, response = await self.api.delete_item(item_id, self.settings.get("riven_key"))
+        success, response = await self.api.delete_item(item_id, self.riven_key)
         if success:
             self.notify(f"Item deleted.", severity="information")
+            self._library_page_cache.clear()
             main_content.item_details = None 
             await self._refresh_current_item_data_and_ui(delay=self.refresh_delay_seconds) 
         else:
@@ -1884,7 +2307,7 @@ class RivenTUI(App):
         self.run_worker(self.handle_reset())
 
     async def handle_reset(self):
-        main_content = self.query_one(MainContent)
+        main_content = self._get_main_content()
         item_id = main_content.item_details.get("id")
         if not item_id: return
         title = main_content.item_details.get("title") or "Unknown Item"
@@ -1898,9 +2321,10 @@ class RivenTUI(App):
         
         if not confirmed: return
 
-        success, response = await self.api.reset_item(item_id, self.settings.get("riven_key"))
+        success, response = await self.api.reset_item(item_id, self.riven_key)
         if success:
             self.notify("Item reset successfully.", severity="information")
+            self._library_page_cache.clear()
             await self._refresh_current_item_data_and_ui(delay=self.refresh_delay_seconds) 
         else:
             self.notify("Failed to reset item.", severity="error")
@@ -1910,7 +2334,7 @@ class RivenTUI(App):
         self.run_worker(self.handle_retry())
 
     async def handle_retry(self):
-        main_content = self.query_one(MainContent)
+        main_content = self._get_main_content()
         item_id = main_content.item_details.get("id")
         if not item_id: return
         title = main_content.item_details.get("title") or "Unknown Item"
@@ -1924,9 +2348,10 @@ class RivenTUI(App):
         
         if not confirmed: return
 
-        success, response = await self.api.retry_item(item_id, self.settings.get("riven_key"))
+        success, response = await self.api.retry_item(item_id, self.riven_key)
         if success:
             self.notify("Item sent for retry.", severity="information")
+            self._library_page_cache.clear()
             await self._refresh_current_item_data_and_ui(delay=self.refresh_delay_seconds) 
         else:
             self.notify("Failed to retry item.", severity="error")
@@ -1937,8 +2362,8 @@ class RivenTUI(App):
 
     async def _run_manual_scrape(self):
         """Rebuilt Manual Scrape Flow with Abort Safety."""
-        main_content = self.query_one(MainContent)
-        riven_key = self.settings.get("riven_key")
+        main_content = self._get_main_content()
+        riven_key = self.riven_key
         
         # 1. IDs
         tmdb_id = main_content.item_data.get("id")
@@ -1985,7 +2410,7 @@ class RivenTUI(App):
             self.stop_spinner()
         
     async def _finalize_movie_scrape(self, session_id: str, containers_files: List[dict]):
-        riven_key = self.settings.get("riven_key")
+        riven_key = self.riven_key
         
         # Filter for files that have a download_url (is cached)
         cached_files = [f for f in containers_files if f.get("download_url")]
@@ -1994,8 +2419,14 @@ class RivenTUI(App):
             self.notify("No cached files found in this torrent.", severity="error")
             return
 
-        # Pick largest cached file
-        video_file = max(cached_files, key=lambda f: f.get('filesize', 0))
+        # Pick largest cached file; entries without a filesize can't win.
+        # Some backends omit the field entirely — fall back to the first
+        # cached file rather than dead-ending the scrape.
+        video_file = max(
+            (f for f in cached_files if f.get("filesize") is not None),
+            key=itemgetter("filesize"),
+            default=cached_files[0],
+        )
         file_id = str(video_file.get("file_id") or "1")
         
         # STEP 4: select_files (Payload matches Attempt 2 success)
@@ -2026,8 +2457,8 @@ class RivenTUI(App):
             self.notify(f"Selection Error: {err}", severity="error")
             
     async def _finalize_tv_scrape(self, session_id: str, containers_files: List[dict]):
-        main_content = self.query_one(MainContent)
-        riven_key = self.settings.get("riven_key")
+        main_content = self._get_main_content()
+        riven_key = self.riven_key
         
         filenames = [f.get("filename") for f in containers_files if f.get("filename")]
         response, error = await self.api.parse_torrent_titles(filenames, riven_key)
@@ -2072,7 +2503,7 @@ class RivenTUI(App):
 
     @on(Button.Pressed, "#btn-add")
     async def handle_add(self):
-        main_content = self.query_one(MainContent)
+        main_content = self._get_main_content()
         if not main_content.tmdb_details:
             return
         tmdb_details = main_content.tmdb_details
@@ -2085,9 +2516,10 @@ class RivenTUI(App):
             self.notify(f"Missing {id_type[:-1].upper()} for add.", severity="error")
             return
         self.notify(f"Adding '{title}' to library...")
-        success, response = await self.api.add_item(add_media_type, id_type, str(id_to_add), self.settings.get("riven_key"))
+        success, response = await self.api.add_item(add_media_type, id_type, str(id_to_add), self.riven_key)
         if success:
             self.notify(f"'{title}' added successfully!", severity="success")
+            self._library_page_cache.clear()
             await self._refresh_current_item_data_and_ui(delay=self.refresh_delay_seconds) 
         else:
             self.notify(f"Failed to add '{title}': {response}", severity="error")
@@ -2166,7 +2598,7 @@ class RivenTUI(App):
         
         # Update sidebar
         try:
-            self.query_one(Sidebar).update_selection_count(len(self.library_selection))
+            self._get_sidebar().update_selection_count(len(self.library_selection))
         except:
             pass
             
@@ -2185,7 +2617,7 @@ class RivenTUI(App):
         self.notify(f"Cleared selection ({count} items).", severity="success")
         
         try:
-            self.query_one(Sidebar).update_selection_count(0)
+            self._get_sidebar().update_selection_count(0)
         except:
             pass
         
@@ -2234,6 +2666,7 @@ class RivenTUI(App):
         if success:
             self.notify(f"Successfully executed {display_name} on {count} items.", severity="success")
             self.log_message(f"Bulk {display_name}: Success.")
+            self._library_page_cache.clear()
             self.library_selection.clear()
             if self.last_library_filters:
                 self.run_worker(self.show_library_items(**self.last_library_filters), name="show_library_items", exclusive=True)
@@ -2258,7 +2691,7 @@ class RivenTUI(App):
 
     @on(Button.Pressed, "#btn-advanced-toggle")
     def on_advanced_toggle(self):
-        self.query_one(Sidebar).toggle_advanced()
+        self._get_sidebar().toggle_advanced()
 
     @on(ApplyFilters)
     async def on_apply_filters_msg(self):
@@ -2269,7 +2702,7 @@ class RivenTUI(App):
         # Fix #4: Wait for sidebar state (pills, checkboxes, list items) to settle
         await asyncio.sleep(0.1)
         
-        sidebar = self.query_one(Sidebar)
+        sidebar = self._get_sidebar()
         filters = sidebar.get_filter_values()
         
         self.run_worker(
@@ -2291,7 +2724,7 @@ class RivenTUI(App):
             try:
                 day = int(event.button.id.split("-")[-1])
                 target_id = f"#day-group-{day}"
-                main_content = self.query_one(MainContent)
+                main_content = self._get_main_content()
                 try:
                     target_widget = main_content.query_one(target_id)
                     target_widget.scroll_visible(top=True)
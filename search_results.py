@@ -10,19 +10,21 @@ from messages import ToggleLibrarySelection
 class SearchResultItem(ListItem):
     def __init__(self, item_data: dict) -> None:
         super().__init__(classes="sidebar-item-layout")
+        # Formatting happens in compose, which only runs for items that
+        # actually reach the screen; building it here would pay for every
+        # result in a large set up front
         self.item_data = item_data
-        
-        # Line 1: Title and Year
-        title_text = item_data.get('title') or item_data.get('name') or 'Unknown'
-        release_date = item_data.get('release_date') or item_data.get('first_air_date')
-        self.year = f" [{release_date[:4]}]" if release_date and len(release_date) >= 4 else ""
-        self.title = title_text
-        self.tagline = item_data.get('tagline', '')
 
     def compose(self) -> ComposeResult:
-        yield Label(Text.assemble((self.title, "bold"), (self.year, "dim")), classes="search-item-title")
-        yield Label(f'"{self.tagline}"' if self.tagline else "", classes="search-item-tagline")
-        
+        # Line 1: Title and Year
+        title_text = self.item_data.get('title') or self.item_data.get('name') or 'Unknown'
+        release_date = self.item_data.get('release_date') or self.item_data.get('first_air_date')
+        year = f" [{release_date[:4]}]" if release_date and len(release_date) >= 4 else ""
+        tagline = self.item_data.get('tagline', '')
+
+        yield Label(Text.assemble((title_text, "bold"), (year, "dim")), classes="search-item-title")
+        yield Label(f'"{tagline}"' if tagline else "", classes="search-item-tagline")
+
         # Line 3: Rating and Genres
         raw_rating = self.item_data.get('vote_average') or self.item_data.get('rating') or 0
         rating = float(raw_rating)
@@ -107,25 +109,14 @@ class LibraryItemCard(ListItem):
 
         self.tagline = item_data.get('tagline', '')
 
-    def action_toggle_selection(self) -> None:
-        self.selected = not self.selected
-        self.post_message(ToggleLibrarySelection(str(self.item_data.get('id')), self.title))
+        # 3. Precompute display strings once at construction; compose() then
+        # only yields cached text, which keeps page renders cheap
+        self._tagline_line = self._build_tagline()
+        self._meta_line = self._build_meta()
 
-    def watch_selected(self, value: bool) -> None:
-        self.set_class(value, "-selected")
-        try:
-            self.query_one(SelectionSquare).update_value(value)
-        except:
-            pass
-
-    @on(SelectionSquare.Toggle)
-    def handle_square_toggle(self) -> None:
-        self.selected = not self.selected
-        self.post_message(ToggleLibrarySelection(str(self.item_data.get('id')), self.title))
-
-    def compose(self) -> ComposeResult:
+    def _build_tagline(self) -> str:
         display_tagline = self.tagline
-        
+
         def to_int(val):
             try: return int(val)
             except: return None
@@ -145,41 +136,59 @@ class LibraryItemCard(ListItem):
                     display_tagline = f"Season {s_int}"
                 else:
                     display_tagline = f"Season {s_int} • {self.tagline}"
+        return display_tagline
+
+    def _build_meta(self) -> str:
+        raw_rating = self.item_data.get('vote_average') or self.item_data.get('rating') or 0
+        rating_val = float(raw_rating)
+        star = "⭐" if rating_val > 0 else ""
+        rating_text = f"{star}{rating_val:.1f}" if rating_val > 0 else "No Rating"
+
+        genre_ids = self.item_data.get('genre_ids', [])
+        genre_names = []
+        if hasattr(self.app, "tmdb_genres"):
+            genre_names = [self.app.tmdb_genres.get(gid) for gid in genre_ids if self.app.tmdb_genres.get(gid)]
+
+        if not genre_names and self.item_data.get('genres'):
+            for g in self.item_data['genres']:
+                if isinstance(g, str):
+                    genre_names.append(g.capitalize())
+                elif isinstance(g, dict) and g.get('name'):
+                    genre_names.append(g['name'].capitalize())
+
+        genres_text = ", ".join(genre_names) if genre_names else ""
+        state = self.item_data.get('state', 'Unknown').title()
+        content_rating = self.item_data.get('content_rating') or 'N/A'
+
+        meta_parts = [rating_text]
+        if genres_text: meta_parts.append(genres_text)
+        if self.item_data.get('is_anime'):
+            meta_parts.append("[bold magenta]Anime[/]")
+        meta_parts.extend([state, content_rating])
+        return " • ".join(meta_parts)
+
+    def action_toggle_selection(self) -> None:
+        self.selected = not self.selected
+        self.post_message(ToggleLibrarySelection(str(self.item_data.get('id')), self.title))
 
+    def watch_selected(self, value: bool) -> None:
+        self.set_class(value, "-selected")
+        try:
+            self.query_one(SelectionSquare).update_value(value)
+        except:
+            pass
+
+    @on(SelectionSquare.Toggle)
+    def handle_square_toggle(self) -> None:
+        self.selected = not self.selected
+        self.post_message(ToggleLibrarySelection(str(self.item_data.get('id')), self.title))
+
+    def compose(self) -> ComposeResult:
         with Horizontal(classes="card-main-row"):
             yield SelectionColumn(self.selected)
-            
+
             with Vertical(classes="card-content-col"):
                 yield Label(Text.assemble((self.title, "bold"), (self.year, "dim")), classes="search-item-title")
-                yield Label(f'"{display_tagline}"' if display_tagline else "", classes="search-item-tagline")
-
-                # Line 3: Meta
-                raw_rating = self.item_data.get('vote_average') or self.item_data.get('rating') or 0
-                rating_val = float(raw_rating)
-                star = "⭐" if rating_val > 0 else ""
-                rating_text = f"{star}{rating_val:.1f}" if rating_val > 0 else "No Rating"
-                
-                genre_ids = self.item_data.get('genre_ids', [])
-                genre_names = []
-                if hasattr(self.app, "tmdb_genres"):
-                    genre_names = [self.app.tmdb_genres.get(gid) for gid in genre_ids if self.app.tmdb_genres.get(gid)]
-                
-                if not genre_names and self.item_data.get('genres'):
-                    for g in self.item_data['genres']:
-                        if isinstance(g, str):
-                            genre_names.append(g.capitalize())
-                        elif isinstance(g, dict) and g.get('name'):
-                            genre_names.append(g['name'].capitalize())
-                    
-                genres_text = ", ".join(genre_names) if genre_names else ""
-                state = self.item_data.get('state', 'Unknown').title()
-                content_rating = self.item_data.get('content_rating') or 'N/A'
-                
-                meta_parts = [rating_text]
-                if genres_text: meta_parts.append(genres_text)
-                if self.item_data.get('is_anime'):
-                    meta_parts.append("[bold magenta]Anime[/]")
-                meta_parts.extend([state, content_rating])
-                
-                yield Label(" • ".join(meta_parts), classes="search-item-meta")
+                yield Label(f'"{self._tagline_line}"' if self._tagline_line else "", classes="search-item-tagline")
+                yield Label(self._meta_line, classes="search-item-meta")
         yield Label("") # Blank line for spacing
\ No newline at end of file
@@ -4,12 +4,16 @@ from textual.widgets import Static, Label, ListView, ListItem, Button, Input, Se
 from textual.message import Message
 from textual import on
 from textual.reactive import reactive
-from typing import List, Dict
+from typing import List, Dict, Optional
 import calendar
 from search import SearchArea
 from messages import PageChanged
 from search_results import SelectionSquare
 
+# Snapshot of calendar.month_name; the lazy locale sequence rebuilds the
+# string on every index and this runs per month navigation
+_MONTH_NAMES = tuple(calendar.month_name)
+
 class ApplyFilters(Message):
     pass
 
@@ -75,6 +79,12 @@ class StateListItem(ListItem):
         self.post_message(self.Changed(self))
 
 class Sidebar(Container):
+    # Last values pushed into the calendar grid and pagination row;
+    # identical updates (e.g. a refresh landing on the same page) skip the
+    # teardown and label work entirely
+    _last_calendar_grid: Optional[tuple] = None
+    _last_pagination: Optional[tuple] = None
+
     @on(StateListItem.Changed)
     def on_state_changed(self, event: StateListItem.Changed):
         items = self.query(StateListItem)
@@ -191,11 +201,16 @@ class Sidebar(Container):
         self.show_blank()
 
     async def update_calendar_grid(self, year: int, month: int, active_days: set) -> None:
+        state = (year, month, frozenset(active_days))
+        if state == self._last_calendar_grid:
+            return
+        self._last_calendar_grid = state
+
         self.query_one("#label-year-sidebar", Label).update(str(year))
-        self.query_one("#label-month-sidebar", Label).update(calendar.month_name[month])
+        self.query_one("#label-month-sidebar", Label).update(_MONTH_NAMES[month])
         
         container = self.query_one("#calendar-grid-container")
-        await container.query("*").remove()
+        await container.remove_children()
         
         # Header - Dynamic based on locale
         first_day = calendar.firstweekday()
@@ -204,8 +219,8 @@ class Sidebar(Container):
         ordered_days = days[first_day:] + days[:first_day]
         
         header_labels = [Label(day, classes="grid-cell grid-header-cell") for day in ordered_days]
-        await container.mount(Horizontal(*header_labels, classes="calendar-grid-row"))
-        
+        rows = [Horizontal(*header_labels, classes="calendar-grid-row")]
+
         # Weeks - Dynamic based on locale
         cal_obj = calendar.Calendar(firstweekday=first_day)
         cal = cal_obj.monthdayscalendar(year, month)
@@ -215,13 +230,28 @@ class Sidebar(Container):
                 if day == 0:
                     week_widgets.append(Label(" ", classes="grid-cell"))
                 else:
+                    # Classes (incl. has-content) are set via constructor so no
+                    # post-mount add_class triggers a style recomputation
                     classes = "grid-cell day-cell"
                     if day in active_days:
                         classes += " has-content"
                     week_widgets.append(Button(str(day), id=f"btn-cal-day-{day}", classes=classes))
-            await container.mount(Horizontal(*week_widgets, classes="calendar-grid-row"))
+            rows.append(Horizontal(*week_widgets, classes="calendar-grid-row"))
+
+        # Mount all rows in one batch instead of awaiting per-row mounts
+        await container.mount_all(rows)
 
     def update_pagination(self, page: int, total_pages: int, total_items: int = 0, selected_count: int = 0) -> None:
+        # The selection label is also updated directly on toggle/clear, so it
+        # must stay ahead of the memo gate or a cleared selection with an
+        # unchanged page would keep showing the stale count
+        self.update_selection_count(selected_count, total_items)
+
+        state = (page, total_pages)
+        if state == self._last_pagination:
+            return
+        self._last_pagination = state
+
         try:
             prev_btn = self.query_one("#btn-prev-page", Button)
             prev_btn.disabled = page <= 1
@@ -238,8 +268,6 @@ class Sidebar(Container):
             self.query_one("#sidebar-page-label", Static).update(f"[bold]{page}[/] of [bold]{total_pages}[/]")
         except Exception:
             pass
-            
-        self.update_selection_count(selected_count, total_items)
 
     def update_selection_count(self, selected: int, total: int = 0) -> None:
         try: